@@ -2,31 +2,46 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import json
+import mmap
 import os
+import re
 import subprocess
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, Iterator
 
 
-def run(cmd: list[str], *, cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess:
-    return subprocess.run(cmd, cwd=cwd, check=check, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+def run_out(cmd: list[str], *, cwd: Path | None = None) -> bytes:
+    # stderr is left attached to the terminal so git errors surface directly.
+    # Output stays bytes; callers only strip or fsdecode it.
+    return subprocess.check_output(cmd, cwd=cwd)
 
 
+@functools.lru_cache(maxsize=None)
 def git_root() -> Path:
-    res = run(["git", "rev-parse", "--show-toplevel"])
-    return Path(res.stdout.strip())
+    return Path(os.fsdecode(run_out(["git", "rev-parse", "--show-toplevel"]).strip()))
 
 
 def git_status_dirty(repo_root: Path) -> bool:
-    res = run(["git", "status", "--porcelain=v1"], cwd=repo_root)
-    return bool(res.stdout.strip())
+    # Untracked files count: the scan rewrites them too, and those edits could not be
+    # reviewed or reverted through git. Submodules are skipped to keep this cheap.
+    return bool(
+        run_out(
+            ["git", "status", "--porcelain=v1", "--untracked-files=normal", "--ignore-submodules=all"],
+            cwd=repo_root,
+        ).strip()
+    )
 
 
-def is_text_file(path: Path) -> bool:
-    # Heuristic: treat known project_management file types as text.
-    text_suffixes = {
+# Heuristic: treat known project_management file types as text. `.md.tmpl`
+# is covered by `.tmpl`.
+TEXT_SUFFIXES = frozenset(
+    {
         ".md",
         ".txt",
         ".json",
@@ -38,11 +53,18 @@ def is_text_file(path: Path) -> bool:
         ".ps1",
         ".py",
     }
-    if path.suffix in text_suffixes:
-        return True
-    if path.name.endswith(".md.tmpl"):
-        return True
-    return False
+)
+
+
+def name_suffix(name: str) -> str:
+    # Same result as Path(name).suffix for the suffixes we care about, without building a Path.
+    idx = name.rfind(".")
+    return name[idx:] if idx > 0 else ""
+
+
+def is_text_file(name: str) -> bool:
+    # Takes a bare file name so the scanners never build a Path just to filter.
+    return name_suffix(name) in TEXT_SUFFIXES
 
 
 @dataclass(frozen=True)
@@ -106,6 +128,24 @@ def compute_archive_plan(repo_root: Path, src_dir: Path) -> ArchivePlan:
         strict_needles=strict_needles,
     )
 
+def _check_disjoint(paths: list[Path], label: str) -> None:
+    seen: list[Path] = []
+    for path in paths:
+        for other in seen:
+            if path == other or other in path.parents or path in other.parents:
+                raise ValueError(f"{label} overlap: {other.as_posix()} and {path.as_posix()}")
+        seen.append(path)
+
+
+def check_disjoint_sources(plans: list[ArchivePlan]) -> None:
+    # Destinations are checked too: sources from different buckets can share a tail and so
+    # map to the same (or a nested) _archived/ target. Runs before any `git mv`.
+    for plan in plans:
+        assert plan.src_dir_repo is not None and plan.dst_dir_repo is not None
+    _check_disjoint([plan.src_dir_repo for plan in plans], "Sources")
+    _check_disjoint([plan.dst_dir_repo for plan in plans], "Destinations")
+
+
 def compute_rewrite_only_plan(from_prefix: str, to_prefix: str) -> ArchivePlan:
     from_prefix = from_prefix.strip()
     to_prefix = to_prefix.strip()
@@ -127,9 +167,17 @@ def compute_rewrite_only_plan(from_prefix: str, to_prefix: str) -> ArchivePlan:
     )
 
 
-def should_skip_dir(dirname: str) -> bool:
-    # Keep this conservative: avoid rewriting vendored/build/worktree content.
-    return dirname in {
+def compile_replacements(replacements: list[tuple[str, str]]) -> tuple[re.Pattern[str], dict[str, str]]:
+    # Longest-first alternation so `./docs/...` wins over its `docs/...` suffix
+    # and every file is rewritten in a single pass.
+    mapping = dict(replacements)
+    pattern = re.compile("|".join(re.escape(old) for old in sorted(mapping, key=len, reverse=True)))
+    return pattern, mapping
+
+
+# Keep this conservative: avoid rewriting vendored/build/worktree content.
+SKIP_DIRS = frozenset(
+    {
         ".git",
         "target",
         "node_modules",
@@ -140,68 +188,297 @@ def should_skip_dir(dirname: str) -> bool:
         ".venv",
         "__pycache__",
     }
+)
 
 
-def iter_repo_text_files(repo_root: Path) -> Iterator[Path]:
-    for root, dirnames, filenames in os.walk(repo_root):
-        dirnames[:] = [d for d in dirnames if not should_skip_dir(d)]
+def iter_repo_text_files(repo_root: Path) -> Iterator[str]:
+    # Yields repo-relative paths. Let git enumerate tracked and untracked-but-not-ignored
+    # files from its index rather than re-walking the tree; fall back to a walk outside
+    # a git checkout. SKIP_DIRS still applies, since some of those directories hold
+    # tracked files.
+    try:
+        out = subprocess.check_output(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=repo_root,
+            stderr=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        yield from walk_repo_text_files(repo_root)
+        return
+
+    for raw in out.split(b"\x00"):
+        if not raw:
+            continue
+        rel = os.fsdecode(raw)
+        *dirs, name = rel.split("/")
+        if not is_text_file(name):
+            continue
+        if not SKIP_DIRS.isdisjoint(dirs):
+            continue
+        yield rel
+
+
+def walk_repo_text_files(repo_root: Path) -> Iterator[str]:
+    # fwalk descends through directory fds (openat/fstatat), so each directory is
+    # resolved one component at a time rather than from the root. os.walk covers
+    # platforms without it; neither follows symlinked directories.
+    root = os.fspath(repo_root)
+    walk = os.fwalk if hasattr(os, "fwalk") else os.walk
+    for dirpath, dirnames, filenames, *_ in walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        rel_dir = os.path.relpath(dirpath, root)
+        prefix = "" if rel_dir == os.curdir else rel_dir + os.sep
         for name in filenames:
-            path = Path(root) / name
-            if is_text_file(path):
-                yield path
+            if is_text_file(name):
+                yield prefix + name
+
+
+# Avoid huge file rewrites (logs, corpora, large fixtures).
+MAX_TEXT_FILE_BYTES = 5 * 1024 * 1024
+BINARY_PROBE_BYTES = 4096
+# Files up to this size are read into a reused buffer; larger ones are mmapped.
+SMALL_FILE_BYTES = 256 * 1024
+
+# One per process: scan workers are processes, each reading files one at a time.
+_read_buffer = bytearray(SMALL_FILE_BYTES)
 
 
-def rewrite_paths_in_file(path: Path, replacements: list[tuple[str, str]]) -> tuple[bool, str]:
+def read_text_file(
+    path: str | Path, needles: tuple[bytes, ...] = (), *, dir_fd: int | None = None
+) -> str | None:
+    # None means unreadable, too large, binary-ish, or not UTF-8 -- or, when
+    # `needles` is given, that the file contains none of them. A relative `path`
+    # is opened against `dir_fd` when given.
     try:
-        raw = path.read_bytes()
-    except OSError:
-        return False, ""
+        with open(os.open(path, os.O_RDONLY, dir_fd=dir_fd), "rb", buffering=0) as fh:
+            size = os.fstat(fh.fileno()).st_size
+            if size > MAX_TEXT_FILE_BYTES:
+                return None
+            if size == 0:
+                return None if needles else ""
+            if size <= SMALL_FILE_BYTES:
+                # Most files are small: read into the reused buffer, so a file that
+                # is rejected below never costs an allocation.
+                buf = _read_buffer
+                got = 0
+                with memoryview(buf) as view:
+                    while got < size:
+                        n = fh.readinto(view[got:size])
+                        if not n:
+                            break
+                        got += n
+                return decode_text(buf, got, needles)
+            # mmap lets the search run over the page cache without copying the file.
+            with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return decode_text(mm, len(mm), needles)
+    except (OSError, ValueError):
+        return None
+
+
+def decode_text(data: bytearray | mmap.mmap, size: int, needles: tuple[bytes, ...]) -> str | None:
+    # Checks the first `size` bytes of `data` in place (C memchr/memmem) and only
+    # decodes them once they pass: no NUL bytes, and a hit for one of `needles`.
+    if data.find(b"\x00", 0, min(size, BINARY_PROBE_BYTES)) != -1:
+        return None
+    if needles and all(data.find(needle, 0, size) == -1 for needle in needles):
+        return None
+    if data.find(b"\x00", BINARY_PROBE_BYTES, size) != -1:
+        return None
+    with memoryview(data) as view, view[:size] as text:
+        try:
+            return str(text, "utf-8")
+        except UnicodeDecodeError:
+            return None
+
+
+def rewrite_paths_in_text(text: str, pattern: re.Pattern[str], mapping: dict[str, str]) -> tuple[bool, str]:
+    # Returns (changed, text after rewriting); the input is returned as-is when nothing changes.
+    new_text, count = pattern.subn(lambda m: mapping[m.group(0)], text)
+    if not count or new_text == text:
+        return False, text
+
+    return True, new_text
+
+
+def probe_needles(keys: list[str]) -> tuple[bytes, ...]:
+    # A file can only be rewritten or flagged if it contains one of `keys`. Keys
+    # that contain a shorter key (`./docs/x` vs `docs/x`) can never be the only
+    # hit, so the byte-level probe only needs the minimal ones.
+    encoded = sorted({key.encode("utf-8") for key in keys}, key=lambda key: (len(key), key))
+    minimal: list[bytes] = []
+    for key in encoded:
+        if not any(shorter in key for shorter in minimal):
+            minimal.append(key)
+    return tuple(minimal)
+
+
+def scan_workers() -> int:
+    # Decoding and rewriting are CPU-bound Python work, so use one process per core.
+    return os.cpu_count() or 1
 
-    # Avoid huge file rewrites (logs, corpora, large fixtures).
-    if len(raw) > 5 * 1024 * 1024:
-        return False, ""
 
-    # Skip binary-ish files.
-    if b"\x00" in raw:
-        return False, ""
+def open_repo_root(repo_root: str) -> int | None:
+    # Files are opened relative to one repo-root directory fd (openat), so each open
+    # only resolves the repo-relative part of the path.
+    return os.open(repo_root, os.O_RDONLY) if os.open in os.supports_dir_fd else None
 
+
+# Files whose scan found nothing to rewrite or report, keyed by repo-relative path
+# to (st_mtime_ns, st_size). Persisted under the git dir between runs.
+SCAN_CACHE_NAME = "substrate-scan-cache.json"
+# Files modified this close to the scan start are not cached: on coarse-timestamp
+# filesystems a later edit could leave mtime unchanged (git's "racily clean" case).
+SCAN_CACHE_RACY_NS = 2_000_000_000
+
+
+def scan_cache_key(repo_root: Path, pattern: re.Pattern[str], strict_needles: list[str]) -> list[str] | None:
+    # A cached "nothing found" is only valid for the same HEAD and the same needles.
+    # None when there is no commit to key on (or no git at all).
     try:
-        text = raw.decode("utf-8")
-    except UnicodeDecodeError:
-        return False, ""
+        head = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=repo_root, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [os.fsdecode(head.strip()), pattern.pattern, *strict_needles]
 
-    original = text
-    for old, new in replacements:
-        text = text.replace(old, new)
 
-    if text == original:
-        return False, ""
+def scan_cache_path(repo_root: Path) -> Path | None:
+    try:
+        out = subprocess.check_output(
+            ["git", "rev-parse", "--git-path", SCAN_CACHE_NAME], cwd=repo_root, stderr=subprocess.DEVNULL
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return repo_root / os.fsdecode(out.strip())
+
+
+def load_scan_cache(path: Path, key: list[str]) -> dict[str, tuple[int, int]]:
+    # A missing, unreadable, or differently keyed cache is simply empty.
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("key") != key or not isinstance(data.get("files"), dict):
+        return {}
+    return {rel: tuple(sig) for rel, sig in data["files"].items()}
+
 
-    return True, text
+def save_scan_cache(path: Path, key: list[str], files: dict[str, tuple[int, int]]) -> None:
+    # Best effort: write a sibling temp file and rename it into place.
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps({"key": key, "files": files}, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+@dataclass(frozen=True)
+class ScanJob:
+    repo_root: str
+    pattern: re.Pattern[str]
+    mapping: dict[str, str]
+    strict_needles: list[str]
+    probe: tuple[bytes, ...]
+    # One alternation sweeps all strict needles in a single pass over the text.
+    needle_re: re.Pattern[str]
+    dry_run: bool
+    cache: dict[str, tuple[int, int]]
+
+
+# Per-worker-process state, set once by _init_scan_worker.
+_scan_job: ScanJob | None = None
+_scan_root_fd: int | None = None
+
+
+def _init_scan_worker(job: ScanJob) -> None:
+    global _scan_job, _scan_root_fd
+    _scan_job = job
+    _scan_root_fd = open_repo_root(job.repo_root)
 
 
-def find_remaining_references(
-    repo_root: Path, strict_needles: list[str]
-) -> list[tuple[Path, str]]:
+def _scan_file(rel: str) -> tuple[str, bool, bytes | None, str | None, tuple[int, int] | None]:
+    # Runs in a worker process. Returns (rel, changed, bytes to write, first
+    # remaining needle, (mtime_ns, size) at scan time); writing is left to the parent.
+    job = _scan_job
+    assert job is not None
+    path = rel if _scan_root_fd is not None else os.path.join(job.repo_root, rel)
+    try:
+        st = os.stat(path, dir_fd=_scan_root_fd)
+    except OSError:
+        return rel, False, None, None, None
+    sig = (st.st_mtime_ns, st.st_size)
+    if job.cache.get(rel) == sig:
+        return rel, False, None, None, sig
+    text = read_text_file(path, job.probe, dir_fd=_scan_root_fd)
+    if text is None:
+        return rel, False, None, None, sig
+    changed, new_text = rewrite_paths_in_text(text, job.pattern, job.mapping)
+    new_data = new_text.encode("utf-8") if changed and not job.dry_run else None
+    if job.needle_re.search(new_text) is None:
+        return rel, changed, new_data, None, sig
+    # Rare path: report the first needle in plan order, as before.
+    return rel, changed, new_data, next(needle for needle in job.strict_needles if needle in new_text), sig
+
+
+def scan_and_rewrite(
+    repo_root: Path,
+    pattern: re.Pattern[str],
+    mapping: dict[str, str],
+    strict_needles: list[str],
+    *,
+    dry_run: bool,
+    use_cache: bool = True,
+) -> tuple[list[Path], list[tuple[Path, str]]]:
+    # One walk and one read per file: rewrite it, then check the rewritten text
+    # for strict needles. Returns repo-relative (modified, remaining) in walk order.
+    # Files that came up empty on a previous run with the same HEAD and needles,
+    # and are unchanged since (mtime and size), are not read again.
+    cache_key = scan_cache_key(repo_root, pattern, strict_needles) if use_cache else None
+    cache_path = scan_cache_path(repo_root) if cache_key is not None else None
+    cache = load_scan_cache(cache_path, cache_key) if cache_path is not None else {}
+    started_ns = time.time_ns()
+
+    job = ScanJob(
+        repo_root=os.fspath(repo_root),
+        pattern=pattern,
+        mapping=mapping,
+        strict_needles=strict_needles,
+        probe=probe_needles([*mapping, *strict_needles]),
+        needle_re=re.compile("|".join(re.escape(needle) for needle in strict_needles)),
+        dry_run=dry_run,
+        cache=cache,
+    )
+
+    modified: list[Path] = []
     remaining: list[tuple[Path, str]] = []
-    for path in iter_repo_text_files(repo_root):
-        try:
-            raw = path.read_bytes()
-        except OSError:
-            continue
-        if b"\x00" in raw:
-            continue
-        if len(raw) > 5 * 1024 * 1024:
-            continue
-        try:
-            text = raw.decode("utf-8")
-        except UnicodeDecodeError:
-            continue
-        for needle in strict_needles:
-            if needle in text:
-                remaining.append((path.relative_to(repo_root), needle))
-                break
-    return remaining
+    clean: dict[str, tuple[int, int]] = {}
+    root_fd = open_repo_root(job.repo_root)
+    try:
+        # Only paths and rewritten bytes cross the process boundary.
+        with ProcessPoolExecutor(
+            max_workers=scan_workers(), initializer=_init_scan_worker, initargs=(job,)
+        ) as pool:
+            for rel, changed, new_data, needle, sig in pool.map(
+                _scan_file, iter_repo_text_files(repo_root), chunksize=64
+            ):
+                if new_data is not None:
+                    # All writes happen here, in the parent. Raw bytes; no newline translation.
+                    path = rel if root_fd is not None else os.path.join(job.repo_root, rel)
+                    with open(os.open(path, os.O_WRONLY | os.O_TRUNC, dir_fd=root_fd), "wb") as fh:
+                        fh.write(new_data)
+                if changed:
+                    modified.append(Path(rel))
+                if needle is not None:
+                    remaining.append((Path(rel), needle))
+                elif not changed and sig is not None and sig[0] < started_ns - SCAN_CACHE_RACY_NS:
+                    clean[rel] = sig
+    finally:
+        if root_fd is not None:
+            os.close(root_fd)
+
+    if cache_path is not None and cache_key is not None:
+        save_scan_cache(cache_path, cache_key, clean)
+    return modified, remaining
 
 
 def main() -> int:
@@ -214,7 +491,14 @@ def main() -> int:
             "  docs/project_management/packs/active/world-sync -> docs/project_management/_archived/active/world-sync\n"
         )
     )
-    parser.add_argument("--src", help="Directory to archive (e.g. docs/project_management/packs/<bucket>/<feature>)")
+    parser.add_argument(
+        "--src",
+        nargs="+",
+        help=(
+            "Directory to archive (e.g. docs/project_management/packs/<bucket>/<feature>). "
+            "Pass several to archive them all with a single repo scan."
+        ),
+    )
     parser.add_argument("--dry-run", action="store_true", help="Print planned actions without modifying anything")
     parser.add_argument(
         "--rewrite-only",
@@ -230,6 +514,11 @@ def main() -> int:
         action="store_true",
         help="Allow running with a dirty git working tree (not recommended)",
     )
+    parser.add_argument(
+        "--no-scan-cache",
+        action="store_true",
+        help=f"Read every candidate file instead of trusting the scan cache in the git dir ({SCAN_CACHE_NAME})",
+    )
     args = parser.parse_args()
 
     repo_root = git_root()
@@ -239,7 +528,7 @@ def main() -> int:
 
     try:
         if args.rewrite_only and args.from_prefix and args.to_prefix:
-            plan = compute_rewrite_only_plan(args.from_prefix, args.to_prefix)
+            plans = [compute_rewrite_only_plan(args.from_prefix, args.to_prefix)]
         else:
             if not args.src:
                 print(
@@ -247,21 +536,22 @@ def main() -> int:
                     file=sys.stderr,
                 )
                 return 2
-            plan = compute_archive_plan(repo_root, repo_root / args.src)
+            plans = [compute_archive_plan(repo_root, repo_root / src) for src in args.src]
+            check_disjoint_sources(plans)
     except ValueError as e:
         print(f"ERROR: {e}", file=sys.stderr)
         return 2
 
-    src_abs = (repo_root / plan.src_dir_repo) if plan.src_dir_repo else None
-    dst_abs = (repo_root / plan.dst_dir_repo) if plan.dst_dir_repo else None
-
-    if plan.src_dir_repo is not None and plan.dst_dir_repo is not None:
-        print(f"SRC={plan.src_dir_repo.as_posix()}")
-        print(f"DST={plan.dst_dir_repo.as_posix()}")
-    else:
-        print("SRC=(none)")
-        print("DST=(none)")
-    for old, new in plan.replacements:
+    for plan in plans:
+        if plan.src_dir_repo is not None and plan.dst_dir_repo is not None:
+            print(f"SRC={plan.src_dir_repo.as_posix()}")
+            print(f"DST={plan.dst_dir_repo.as_posix()}")
+        else:
+            print("SRC=(none)")
+            print("DST=(none)")
+    replacements = [pair for plan in plans for pair in plan.replacements]
+    strict_needles = [needle for plan in plans for needle in plan.strict_needles]
+    for old, new in replacements:
         print(f"REWRITE={old} -> {new}")
 
     if args.dry_run:
@@ -275,26 +565,24 @@ def main() -> int:
         print("MOVE=1")
 
     if not args.rewrite_only:
-        assert src_abs is not None
-        assert dst_abs is not None
-        if args.dry_run:
-            print(f"[dry-run] git mv {plan.src_dir_repo.as_posix()} {plan.dst_dir_repo.as_posix()}")
-        else:
-            dst_abs.parent.mkdir(parents=True, exist_ok=True)
-            subprocess.run(
-                ["git", "mv", plan.src_dir_repo.as_posix(), plan.dst_dir_repo.as_posix()],
-                cwd=repo_root,
-                check=True,
-            )
+        for plan in plans:
+            assert plan.src_dir_repo is not None
+            assert plan.dst_dir_repo is not None
+            if args.dry_run:
+                print(f"[dry-run] git mv {plan.src_dir_repo.as_posix()} {plan.dst_dir_repo.as_posix()}")
+            else:
+                (repo_root / plan.dst_dir_repo).parent.mkdir(parents=True, exist_ok=True)
+                subprocess.run(
+                    ["git", "mv", plan.src_dir_repo.as_posix(), plan.dst_dir_repo.as_posix()],
+                    cwd=repo_root,
+                    check=True,
+                )
 
-    modified: list[Path] = []
-    for path in iter_repo_text_files(repo_root):
-        changed, new_text = rewrite_paths_in_file(path, plan.replacements)
-        if not changed:
-            continue
-        modified.append(path.relative_to(repo_root))
-        if not args.dry_run:
-            path.write_text(new_text, encoding="utf-8", newline="\n")
+    # One scan covers every plan, however many sources were given.
+    pattern, mapping = compile_replacements(replacements)
+    modified, remaining = scan_and_rewrite(
+        repo_root, pattern, mapping, strict_needles, dry_run=args.dry_run, use_cache=not args.no_scan_cache
+    )
 
     if modified:
         print(f"UPDATED_FILES={len(modified)}")
@@ -307,7 +595,6 @@ def main() -> int:
         print("REMAINING_REFERENCES=SKIPPED_DRY_RUN")
         return 0
 
-    remaining = find_remaining_references(repo_root, plan.strict_needles)
     if remaining:
         print(f"REMAINING_REFERENCES={len(remaining)}", file=sys.stderr)
         for path, needle in remaining:
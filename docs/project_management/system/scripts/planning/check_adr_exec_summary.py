@@ -12,6 +12,7 @@ from typing import Dict, List, Optional, Sequence, Set, Tuple
 
 EXEC_HEADING_RE = re.compile(r"^##[ \t]+Executive Summary[ \t]+\((?:Operator)\)[ \t]*\r?$", re.MULTILINE)
 HASH_LINE_RE = re.compile(r"^ADR_BODY_SHA256:[ \t]*([0-9a-f]{64})[ \t]*\r?$", re.MULTILINE)
+NEXT_H2_RE = re.compile(r"^##\s+", re.MULTILINE)
 
 EXISTING_RE = re.compile(r"(?mi)^\s*-\s*Existing:\s+\S")
 NEW_RE = re.compile(r"(?mi)^\s*-\s*New:\s+\S")
@@ -36,18 +37,21 @@ def _find_exec_section(text: str) -> Optional[ExecSection]:
         return None
 
     start = match.start()
-    next_h2 = re.search(r"^##\s+", text[match.end() :], re.MULTILINE)
-    end = (match.end() + next_h2.start()) if next_h2 else len(text)
+    # Search by position rather than slicing so the tail of the ADR is not copied.
+    next_h2 = NEXT_H2_RE.search(text, match.end())
+    end = next_h2.start() if next_h2 else len(text)
 
-    section_text = text[start:end]
-    hash_match = HASH_LINE_RE.search(section_text)
+    hash_match = HASH_LINE_RE.search(text, start, end)
     hash_value = hash_match.group(1) if hash_match else None
     return ExecSection(start=start, end=end, hash_value=hash_value)
 
 
 def _adr_body_hash(text: str, exec_section: ExecSection) -> str:
-    without_exec = text[: exec_section.start] + text[exec_section.end :]
-    return hashlib.sha256(without_exec.encode("utf-8")).hexdigest()
+    # Hash the body on either side of the exec section incrementally rather than
+    # concatenating it into one string first; the digest is identical.
+    digest = hashlib.sha256(text[: exec_section.start].encode("utf-8"))
+    digest.update(text[exec_section.end :].encode("utf-8"))
+    return digest.hexdigest()
 
 
 def _upsert_hash_line(section_text: str, new_hash: str) -> Tuple[str, bool]:
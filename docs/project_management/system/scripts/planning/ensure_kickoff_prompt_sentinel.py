@@ -1,38 +1,55 @@
 #!/usr/bin/env python3
 
 import argparse
+import os
+import re
 from pathlib import Path
+from typing import Iterator
 
 
 SENTINEL = "Do not edit planning docs inside the worktree."
+SENTINEL_BYTES = SENTINEL.encode("utf-8")
+
+
+# A line that is "## Start Checklist" once surrounding whitespace is stripped.
+START_CHECKLIST_RE = re.compile(r"^[^\S\n]*## Start Checklist[^\S\n]*$", re.MULTILINE)
 
 
 def ensure_in_file(path: Path) -> bool:
-    text = path.read_text(encoding="utf-8")
-    if SENTINEL in text:
+    # Most prompts already carry the sentinel; check raw bytes before decoding.
+    raw = path.read_bytes()
+    if SENTINEL_BYTES in raw:
         return False
 
-    lines = text.splitlines(keepends=True)
-    out = []
-    inserted = False
+    # Decode the bytes already read, with read_text's universal-newline handling.
+    text = raw.decode("utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
-    for i, line in enumerate(lines):
-        out.append(line)
-        if inserted:
-            continue
-        if line.strip() == "## Start Checklist":
-            out.append(f"\n{SENTINEL}\n\n")
-            inserted = True
+    # Splice the sentinel in after the first "## Start Checklist" line, or append it.
+    match = START_CHECKLIST_RE.search(text)
+    if match is not None:
+        insert_at = match.end() + 1 if match.end() < len(text) else match.end()
+        updated = f"{text[:insert_at]}\n{SENTINEL}\n\n{text[insert_at:]}"
+    else:
+        updated = f"{text}\n\n{SENTINEL}\n"
 
-    if not inserted:
-        out.append(f"\n\n{SENTINEL}\n")
+    path.write_bytes(updated.encode("utf-8"))
+    return True
 
-    updated = "".join(out)
-    if updated == text:
-        return False
 
-    path.write_text(updated, encoding="utf-8")
-    return True
+def iter_kickoff_prompts(root: str) -> Iterator[Path]:
+    # One scandir walk; only `kickoff_prompts` directories have their `.md` children listed.
+    with os.scandir(root) as it:
+        for entry in it:
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            if entry.name == "kickoff_prompts":
+                with os.scandir(entry.path) as prompts:
+                    for prompt in prompts:
+                        if prompt.name.endswith(".md") and prompt.is_file():
+                            yield Path(prompt.path)
+            yield from iter_kickoff_prompts(entry.path)
 
 
 def main() -> int:
@@ -49,12 +66,9 @@ def main() -> int:
         raise SystemExit(f"Root does not exist: {root}")
 
     changed = 0
-    for kickoff_dir in root.rglob("kickoff_prompts"):
-        if not kickoff_dir.is_dir():
-            continue
-        for path in kickoff_dir.glob("*.md"):
-            if ensure_in_file(path):
-                changed += 1
+    for path in iter_kickoff_prompts(str(root)):
+        if ensure_in_file(path):
+            changed += 1
 
     print(f"Updated kickoff prompts: {changed}")
     return 0
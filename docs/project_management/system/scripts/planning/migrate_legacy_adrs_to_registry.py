@@ -11,17 +11,20 @@ from pathlib import Path
 from typing import Iterator
 
 
-def run(cmd: list[str], *, cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess:
-    return subprocess.run(cmd, cwd=cwd, check=check, text=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+def run(cmd: list[str], *, cwd: Path | None = None, check: bool = True) -> subprocess.CompletedProcess[bytes]:
+    # Raw bytes: callers only strip or fsdecode the output, so skip the text layer.
+    return subprocess.run(cmd, cwd=cwd, check=check, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
 
 
 def git_root() -> Path:
     res = run(["git", "rev-parse", "--show-toplevel"])
-    return Path(res.stdout.strip())
+    return Path(os.fsdecode(res.stdout.strip()))
 
 
 def git_status_dirty(repo_root: Path) -> bool:
-    res = run(["git", "status", "--porcelain=v1"], cwd=repo_root)
+    # Untracked files count: the repo walk rewrites them too, and those edits could not be
+    # reviewed or reverted through git. Submodules are skipped to keep this cheap.
+    res = run(["git", "status", "--porcelain=v1", "--untracked-files=normal", "--ignore-submodules=all"], cwd=repo_root)
     return bool(res.stdout.strip())
 
 
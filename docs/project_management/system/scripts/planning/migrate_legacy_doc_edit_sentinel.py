@@ -4,6 +4,7 @@ import argparse
 import os
 import re
 from pathlib import Path
+from typing import Iterator
 
 
 REPLACEMENTS = [
@@ -46,11 +47,29 @@ REPLACEMENTS = [
 ]
 
 
+# All REPLACEMENTS folded into one alternation (named group per entry, in list
+# order) so each file is scanned once; earlier entries win at the same offset.
+COMBINED_RE = re.compile(
+    "|".join(f"(?P<r{i}>{pattern.pattern})" for i, (pattern, _) in enumerate(REPLACEMENTS)),
+    re.IGNORECASE,
+)
+COMBINED_TEXTS = [replacement for _, replacement in REPLACEMENTS]
+# Every legacy phrase references a path under docs/tasks/; the patterns are
+# case-insensitive, so the marker is checked against ASCII-lowercased bytes.
+CANDIDATE_MARKER = b"docs/tasks/"
+
+
+def _combined_replacement(match: re.Match) -> str:
+    return COMBINED_TEXTS[int(match.lastgroup[1:])]
+
+
 def rewrite_file(path: Path) -> bool:
+    # Most files have no legacy phrase; reject them on raw bytes before decoding.
+    if CANDIDATE_MARKER not in path.read_bytes().lower():
+        return False
+
     original = path.read_text(encoding="utf-8")
-    updated = original
-    for pattern, replacement in REPLACEMENTS:
-        updated = pattern.sub(replacement, updated)
+    updated = COMBINED_RE.sub(_combined_replacement, original)
 
     if updated == original:
         return False
@@ -59,6 +78,20 @@ def rewrite_file(path: Path) -> bool:
     return True
 
 
+CANDIDATE_SUFFIXES = (".md", ".json")
+
+
+def iter_candidate_files(root: str) -> Iterator[str]:
+    # scandir reports entry types from readdir, so non-candidates cost no stat
+    # and no Path allocation.
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_candidate_files(entry.path)
+            elif entry.name.endswith(CANDIDATE_SUFFIXES) and entry.is_file():
+                yield entry.path
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Migrate legacy `docs/tasks/session_log.md` sentinel phrases to the canonical planning-doc sentinel.")
     parser.add_argument(
@@ -73,12 +106,8 @@ def main() -> int:
         raise SystemExit(f"Root does not exist: {root}")
 
     changed = 0
-    for path in root.rglob("*"):
-        if not path.is_file():
-            continue
-        if path.suffix not in {".md", ".json"}:
-            continue
-        if rewrite_file(path):
+    for path in iter_candidate_files(str(root)):
+        if rewrite_file(Path(path)):
             changed += 1
 
     print(f"Updated files: {changed}")
@@ -0,0 +1,225 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+PLANNING_DIR = Path(__file__).resolve().parents[1]
+if str(PLANNING_DIR) not in sys.path:
+    sys.path.insert(0, str(PLANNING_DIR))
+
+import archive_project_management_dir as mod  # noqa: E402
+
+
+def _write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class TestArchiveProjectManagementDir(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_iter_repo_text_files_filters_suffixes_and_skip_dirs(self) -> None:
+        _write_text(self.root / "README.md", "x")
+        _write_text(self.root / "docs" / "plan.md.tmpl", "x")
+        _write_text(self.root / "docs" / "nested" / "tasks.json", "{}")
+        _write_text(self.root / "docs" / "image.png", "x")
+        _write_text(self.root / "target" / "debug" / "notes.md", "x")
+        _write_text(self.root / ".git" / "config.toml", "x")
+        _write_text(self.root / "node_modules" / "pkg" / "index.md", "x")
+
+        found = sorted(Path(p).as_posix() for p in mod.iter_repo_text_files(self.root))
+        self.assertEqual(found, ["README.md", "docs/nested/tasks.json", "docs/plan.md.tmpl"])
+
+    def test_iter_repo_text_files_uses_git_index_in_checkout(self) -> None:
+        subprocess.run(["git", "init", "-q"], cwd=self.root, check=True)
+        _write_text(self.root / ".gitignore", "ignored.md\n")
+        _write_text(self.root / "tracked.md", "x")
+        _write_text(self.root / "untracked.json", "{}")
+        _write_text(self.root / "ignored.md", "x")
+        _write_text(self.root / "dist" / "notes.md", "x")
+        _write_text(self.root / "docs" / "image.png", "x")
+        subprocess.run(["git", "add", "tracked.md", "dist/notes.md"], cwd=self.root, check=True)
+
+        found = sorted(Path(p).as_posix() for p in mod.iter_repo_text_files(self.root))
+        self.assertEqual(found, ["tracked.md", "untracked.json"])
+
+    def test_git_status_dirty_counts_untracked_files(self) -> None:
+        subprocess.run(["git", "init", "-q"], cwd=self.root, check=True)
+        _write_text(self.root / ".gitignore", "ignored.md\n")
+        _write_text(self.root / "tracked.md", "x")
+        subprocess.run(["git", "add", "."], cwd=self.root, check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "init"],
+            cwd=self.root,
+            check=True,
+        )
+        _write_text(self.root / "ignored.md", "docs/a/plan.md\n")
+        self.assertFalse(mod.git_status_dirty(self.root))
+
+        # The scan would rewrite this file, so it must block a run without --allow-dirty.
+        _write_text(self.root / "notes" / "untracked.md", "docs/a/plan.md\n")
+        self.assertIn("notes/untracked.md", list(mod.iter_repo_text_files(self.root)))
+        self.assertTrue(mod.git_status_dirty(self.root))
+
+    def test_check_disjoint_sources_rejects_nested_and_duplicate_sources(self) -> None:
+        def plan(src: str, dst: str = "") -> mod.ArchivePlan:
+            return mod.ArchivePlan(
+                src_dir_repo=Path(src),
+                dst_dir_repo=Path(dst or f"archived/{src}"),
+                replacements=[],
+                strict_needles=[],
+            )
+
+        mod.check_disjoint_sources([plan("docs/a/x"), plan("docs/a/xy"), plan("docs/b/x")])
+        with self.assertRaises(ValueError):
+            mod.check_disjoint_sources([plan("docs/a/x"), plan("docs/a/x/y")])
+        with self.assertRaises(ValueError):
+            mod.check_disjoint_sources([plan("docs/a/x/y"), plan("docs/a/x")])
+        with self.assertRaises(ValueError):
+            mod.check_disjoint_sources([plan("docs/a/x"), plan("docs/a/x")])
+
+    def test_check_disjoint_sources_rejects_colliding_and_nested_destinations(self) -> None:
+        pm = "docs/project_management"
+
+        def plan(src: str) -> mod.ArchivePlan:
+            return mod.compute_archive_plan(self.root, self.root / pm / src)
+
+        for src in ("packs/active/foo", "intake/active/foo", "packs/active", "future/active/x", "packs/other/y"):
+            (self.root / pm / src).mkdir(parents=True, exist_ok=True)
+
+        mod.check_disjoint_sources([plan("packs/active/foo"), plan("packs/other/y")])
+        with self.assertRaisesRegex(ValueError, "Destinations overlap"):
+            mod.check_disjoint_sources([plan("packs/active/foo"), plan("intake/active/foo")])
+        with self.assertRaisesRegex(ValueError, "Destinations overlap"):
+            mod.check_disjoint_sources([plan("packs/active"), plan("future/active/x")])
+
+    def test_rewrite_paths_in_text_applies_replacements(self) -> None:
+        plan = mod.compute_rewrite_only_plan("docs/project_management/packs/a", "docs/project_management/_archived/a")
+        text = "see docs/project_management/packs/a/plan.md and ./docs/project_management/packs/a/tasks.json\n"
+
+        changed, new_text = mod.rewrite_paths_in_text(text, *mod.compile_replacements(plan.replacements))
+        self.assertTrue(changed)
+        self.assertEqual(
+            new_text,
+            "see docs/project_management/_archived/a/plan.md and ./docs/project_management/_archived/a/tasks.json\n",
+        )
+
+    def test_rewrite_paths_in_text_does_not_rewrite_replacement_output(self) -> None:
+        plan = mod.compute_rewrite_only_plan("docs/a", "docs/a/b")
+
+        changed, new_text = mod.rewrite_paths_in_text("docs/a ./docs/a\n", *mod.compile_replacements(plan.replacements))
+        self.assertTrue(changed)
+        self.assertEqual(new_text, "docs/a/b ./docs/a/b\n")
+
+    def test_rewrite_paths_in_text_unchanged(self) -> None:
+        plan = mod.compute_rewrite_only_plan("docs/project_management/packs/a", "docs/project_management/_archived/a")
+
+        self.assertEqual(
+            mod.rewrite_paths_in_text("nothing to see\n", *mod.compile_replacements(plan.replacements)),
+            (False, "nothing to see\n"),
+        )
+
+    def test_read_text_file_rejects_binary_and_needle_free_files(self) -> None:
+        text = self.root / "a.md"
+        _write_text(text, "hello docs/x\n")
+        empty = self.root / "empty.md"
+        _write_text(empty, "")
+        late_nul = self.root / "late.md"
+        late_nul.write_bytes(b"a" * (mod.BINARY_PROBE_BYTES + 10) + b"\x00")
+        latin1 = self.root / "latin1.md"
+        latin1.write_bytes(b"caf\xe9 docs/x\n")
+        large = self.root / "large.md"
+        large.write_bytes(b"a" * mod.SMALL_FILE_BYTES + b" docs/x\n")
+
+        self.assertEqual(mod.read_text_file(text), "hello docs/x\n")
+        self.assertEqual(mod.read_text_file(text, (b"docs/x",)), "hello docs/x\n")
+        self.assertIsNone(mod.read_text_file(text, (b"docs/y",)))
+        self.assertEqual(mod.read_text_file(empty), "")
+        self.assertIsNone(mod.read_text_file(empty, (b"docs/x",)))
+        self.assertIsNone(mod.read_text_file(late_nul))
+        self.assertIsNone(mod.read_text_file(latin1, (b"docs/x",)))
+        self.assertIsNone(mod.read_text_file(self.root / "missing.md"))
+        self.assertEqual(mod.read_text_file(large, (b"docs/x",)), "a" * mod.SMALL_FILE_BYTES + " docs/x\n")
+        self.assertIsNone(mod.read_text_file(large, (b"docs/y",)))
+
+    def test_probe_needles_keeps_only_minimal_keys(self) -> None:
+        self.assertEqual(
+            mod.probe_needles(["docs/a", "./docs/a", "docs/a/x", "docs/b", "docs/a"]),
+            (b"docs/a", b"docs/b"),
+        )
+
+    def _scan(self, from_prefix: str, to_prefix: str, *, dry_run: bool) -> tuple[list[Path], list[tuple[Path, str]]]:
+        plan = mod.compute_rewrite_only_plan(from_prefix, to_prefix)
+        pattern, mapping = mod.compile_replacements(plan.replacements)
+        modified, remaining = mod.scan_and_rewrite(self.root, pattern, mapping, plan.strict_needles, dry_run=dry_run)
+        return sorted(modified), sorted(remaining)
+
+    def test_scan_and_rewrite_writes_changed_files(self) -> None:
+        for i in range(20):
+            _write_text(self.root / "docs" / f"ref{i}.md", f"docs/project_management/packs/a/{i}.md\n")
+        _write_text(self.root / "docs" / "other.md", "unrelated\n")
+        (self.root / "docs" / "blob.md").write_bytes(b"docs/project_management/packs/a\x00\x01")
+
+        modified, remaining = self._scan(
+            "docs/project_management/packs/a", "docs/project_management/_archived/a", dry_run=False
+        )
+        self.assertEqual(modified, sorted(Path("docs") / f"ref{i}.md" for i in range(20)))
+        self.assertEqual(remaining, [])
+        self.assertEqual(
+            (self.root / "docs" / "ref3.md").read_text(encoding="utf-8"),
+            "docs/project_management/_archived/a/3.md\n",
+        )
+
+    def test_scan_and_rewrite_dry_run_leaves_files(self) -> None:
+        _write_text(self.root / "ref.md", "docs/project_management/packs/a\n")
+
+        modified, remaining = self._scan(
+            "docs/project_management/packs/a", "docs/project_management/_archived/a", dry_run=True
+        )
+        self.assertEqual(modified, [Path("ref.md")])
+        self.assertEqual(remaining, [])
+        self.assertEqual((self.root / "ref.md").read_text(encoding="utf-8"), "docs/project_management/packs/a\n")
+
+    def test_scan_and_rewrite_reports_needles_left_after_rewrite(self) -> None:
+        _write_text(self.root / "ref.md", "./docs/a/plan.md\n")
+        _write_text(self.root / "other.md", "unrelated\n")
+
+        modified, remaining = self._scan("docs/a", "docs/a/b", dry_run=False)
+        self.assertEqual(modified, [Path("ref.md")])
+        self.assertEqual(remaining, [(Path("ref.md"), "docs/a")])
+
+    def test_scan_and_rewrite_skips_files_unchanged_since_cached_scan(self) -> None:
+        subprocess.run(["git", "init", "-q"], cwd=self.root, check=True)
+        _write_text(self.root / "clean.md", "unrelated\n")
+        _write_text(self.root / "other.md", "unrelated too\n")
+        subprocess.run(["git", "add", "."], cwd=self.root, check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "init"],
+            cwd=self.root,
+            check=True,
+        )
+        old_ns = 1_000_000_000_000_000_000
+        for name in ("clean.md", "other.md"):
+            os.utime(self.root / name, ns=(old_ns, old_ns))
+
+        self.assertEqual(self._scan("docs/a", "docs/b", dry_run=True), ([], []))
+
+        # Same size and mtime as the cached scan: the new content is not re-read.
+        (self.root / "clean.md").write_text("docs/a/xx\n", encoding="utf-8")
+        os.utime(self.root / "clean.md", ns=(old_ns, old_ns))
+        # A different mtime invalidates the entry.
+        (self.root / "other.md").write_text("see docs/a/x\n", encoding="utf-8")
+
+        self.assertEqual(self._scan("docs/a", "docs/b", dry_run=True), ([Path("other.md")], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
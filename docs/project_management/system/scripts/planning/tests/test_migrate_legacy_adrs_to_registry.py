@@ -0,0 +1,47 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+
+PLANNING_DIR = Path(__file__).resolve().parents[1]
+if str(PLANNING_DIR) not in sys.path:
+    sys.path.insert(0, str(PLANNING_DIR))
+
+import migrate_legacy_adrs_to_registry as mod  # noqa: E402
+
+
+def _write_text(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+class TestMigrateLegacyAdrsToRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_git_status_dirty_counts_untracked_files(self) -> None:
+        subprocess.run(["git", "init", "-q"], cwd=self.root, check=True)
+        _write_text(self.root / ".gitignore", "ignored.md\n")
+        _write_text(self.root / "tracked.md", "x")
+        subprocess.run(["git", "add", "."], cwd=self.root, check=True)
+        subprocess.run(
+            ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", "commit", "-q", "-m", "init"],
+            cwd=self.root,
+            check=True,
+        )
+        _write_text(self.root / "ignored.md", "docs/project_management/adrs/ADR-0001.md\n")
+        self.assertFalse(mod.git_status_dirty(self.root))
+
+        # The repo walk would rewrite this file, so it must block a run without --allow-dirty.
+        _write_text(self.root / "notes" / "untracked.md", "docs/project_management/adrs/ADR-0001.md\n")
+        self.assertTrue(mod.git_status_dirty(self.root))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+
+PLANNING_DIR = Path(__file__).resolve().parents[1]
+if str(PLANNING_DIR) not in sys.path:
+    sys.path.insert(0, str(PLANNING_DIR))
+
+import validate_tasks_json as mod  # noqa: E402
+
+
+def _write_json(path: Path, data: object) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+class TestValidateTasksJson(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_read_json_reuses_parse_until_file_changes(self) -> None:
+        path = self.root / "tasks.json"
+        _write_json(path, {"tasks": []})
+
+        first = mod._read_json(str(path))
+        self.assertIs(mod._read_json(str(path)), first)
+
+        _write_json(path, {"tasks": [], "meta": {}})
+        self.assertEqual(mod._read_json(str(path)), {"tasks": [], "meta": {}})
+
+    def test_validate_meta_does_not_mutate_document(self) -> None:
+        data = {"meta": {"platforms_required": ["linux"], "wsl_required": True}, "tasks": []}
+
+        meta = mod._validate_meta(data, [], "tasks.json")
+        self.assertEqual(meta["ci_parity_platforms_required"], ["linux"])
+        self.assertEqual(meta["behavior_platforms_required"], ["linux"])
+        self.assertEqual(meta["wsl_task_mode"], "bundled")
+        self.assertEqual(data["meta"], {"platforms_required": ["linux"], "wsl_required": True})
+
+    def test_max_errors_stops_after_limit(self) -> None:
+        _write_json(self.root / "tasks.json", {"meta": {}, "tasks": [{"id": f"t{i}"} for i in range(10)]})
+
+        all_errors, _ = mod.validate_tasks_json(str(self.root))
+        self.assertGreater(len(all_errors), 3)
+
+        errors, _ = mod.validate_tasks_json(str(self.root), max_errors=3)
+        self.assertEqual(errors, all_errors[:3])
+
+        # The budget stops work, not just output: later checks are never reached.
+        with patch.object(mod, "_validate_smoke_linkage") as smoke_check:
+            mod.validate_tasks_json(str(self.root), max_errors=3)
+        smoke_check.assert_not_called()
+
+    def test_external_task_ids_with_unhashable_item_is_reported(self) -> None:
+        _write_json(self.root / "tasks.json", {"meta": {"external_task_ids": ["a", {}]}, "tasks": []})
+
+        errors, tasks_path = mod.validate_tasks_json(str(self.root))
+        self.assertEqual(
+            [err.message for err in errors],
+            [f"{tasks_path}: meta.external_task_ids must be an array of strings"],
+        )
+
+    def _task(self, task_id: str, task_type: str, **overrides: object) -> dict:
+        kickoff = self.root / "kickoff_prompts" / f"{task_id}.md"
+        kickoff.parent.mkdir(parents=True, exist_ok=True)
+        kickoff.write_text("x", encoding="utf-8")
+        task = {
+            "id": task_id,
+            "name": task_id,
+            "type": task_type,
+            "phase": "p",
+            "status": "pending",
+            "description": "d",
+            "references": [],
+            "acceptance_criteria": [],
+            "start_checklist": [],
+            "end_checklist": [],
+            "worktree": f"wt/{task_id}",
+            "integration_task": "S-integ" if task_type in ("code", "test") else task_id,
+            "kickoff_prompt": str(kickoff),
+            "depends_on": [],
+            "concurrent_with": [],
+        }
+        task.update(overrides)
+        return task
+
+    def test_validate_tasks_reports_field_errors_before_reference_errors(self) -> None:
+        tasks = [
+            self._task("S-integ", "integration"),
+            self._task("S-code", "code", name="", depends_on=["nope"]),
+            self._task("S-code", "code", status="done"),
+            {"id": "S-test"},
+        ]
+        _write_json(self.root / "tasks.json", {"meta": {}, "tasks": tasks})
+
+        errors, p = mod.validate_tasks_json(str(self.root))
+        self.assertEqual(
+            [err.message for err in errors],
+            [
+                f"{p}:tasks[1].name: must be a non-empty string",
+                f"{p}:tasks[2].status: must be one of {sorted(mod.ALLOWED_TASK_STATUSES)}, got 'done'",
+                f"{p}:tasks[3]: missing required keys: {', '.join(mod.REQUIRED_TASK_KEYS[1:])}",
+                f"{p}: duplicate task ids: S-code",
+                f"{p}:tasks[1](S-code).depends_on: unknown task id 'nope' "
+                "(if external, add it to tasks.json meta.external_task_ids)",
+            ],
+        )
+
+    def test_validate_tasks_resolves_duplicate_ids_to_the_last_task(self) -> None:
+        tasks = [
+            self._task("S-integ", "integration"),
+            self._task("S-code", "code"),
+            self._task("S-integ", "ops", worktree=None, kickoff_prompt=None, integration_task=None),
+        ]
+        _write_json(self.root / "tasks.json", {"meta": {}, "tasks": tasks})
+
+        errors, p = mod.validate_tasks_json(str(self.root))
+        self.assertEqual(
+            [err.message for err in errors],
+            [
+                f"{p}: duplicate task ids: S-integ",
+                f"{p}:tasks[1](S-code).integration_task: 'S-integ' must reference a task with type=integration",
+            ],
+        )
+
+    def test_validate_tasks_keeps_valid_external_ids_next_to_bad_entries(self) -> None:
+        tasks = [
+            self._task("S-integ", "integration"),
+            self._task("S-code", "code", depends_on=["EXT-1"], concurrent_with=["EXT-1"]),
+        ]
+        _write_json(self.root / "tasks.json", {"meta": {"external_task_ids": ["EXT-1", {}]}, "tasks": tasks})
+
+        errors, p = mod.validate_tasks_json(str(self.root))
+        self.assertEqual(
+            [err.message for err in errors],
+            [f"{p}: meta.external_task_ids must be an array of strings"],
+        )
+
+    def test_integ_task_id_re_classifies_slice_and_platform(self) -> None:
+        def classify(task_id: str) -> object:
+            match = mod.INTEG_TASK_ID_RE.fullmatch(task_id)
+            return None if match is None else (match["slice"], match["platform"])
+
+        self.assertEqual(classify("X-integ"), ("X", None))
+        self.assertEqual(classify("X-integ-core"), ("X", "core"))
+        self.assertEqual(classify("X-integ-wsl"), ("X", "wsl"))
+        self.assertEqual(classify("C1-a-integ-linux"), ("C1-a", "linux"))
+        self.assertIsNone(classify("X-integration"))
+        self.assertIsNone(classify("X-integ-freebsd"))
+        self.assertIsNone(classify("X-code"))
+
+    def test_execution_gates_require_closeout_only_for_final_aggregators(self) -> None:
+        (self.root / "execution_preflight_report.md").write_text("x", encoding="utf-8")
+        tasks = [
+            {"id": "F0-exec-preflight", "type": "ops", "references": ["execution_preflight_report.md"]},
+            {"id": "S-integ", "type": "integration", "references": []},
+            {"id": "S-integ-core", "type": "integration"},
+            {"id": "S-integ-wsl", "type": "integration"},
+            {"id": "T-integration", "type": "integration"},
+        ]
+        errors: list = []
+        mod._validate_execution_gates(str(self.root), {t["id"]: t for t in tasks}, {"execution_gates": True}, errors, "P")
+
+        closeout = self.root / "S-closeout_report.md"
+        slices_closeout = self.root / "slices" / "S" / "S-closeout_report.md"
+        self.assertEqual(
+            [err.message for err in errors],
+            [
+                f"P: meta.execution_gates=true requires {str(closeout)!r} or {str(slices_closeout)!r} to exist",
+                "P: 'S-integ' must reference S-closeout_report.md in references/end_checklist",
+            ],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,46 +1,157 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import glob
 import json
+import mmap
+import operator
 import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Set, Tuple
-
-
-ALLOWED_TASK_TYPES = {"code", "test", "integration", "ops", "investigation"}
-ALLOWED_TASK_STATUSES = {"pending", "in_progress", "completed", "queued", "blocked", "canceled"}
-ALLOWED_PLATFORMS = {"linux", "macos", "windows", "wsl"}
-ALLOWED_PLATFORMS_REQUIRED = {"linux", "macos", "windows"}
-ALLOWED_RUNNERS = {"local", "github-actions", "manual"}
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    import orjson  # Optional: several times faster on large tasks.json files.
+except ImportError:
+    orjson = None
+
+
+ALLOWED_TASK_TYPES = frozenset({"code", "test", "integration", "ops", "investigation"})
+ALLOWED_TASK_STATUSES = frozenset({"pending", "in_progress", "completed", "queued", "blocked", "canceled"})
+ALLOWED_PLATFORMS = frozenset({"linux", "macos", "windows", "wsl"})
+ALLOWED_PLATFORMS_REQUIRED = frozenset({"linux", "macos", "windows"})
+# Identifier-like literals are interned by the compiler already; "github-actions" is not.
+ALLOWED_RUNNERS = frozenset(map(sys.intern, ("local", "github-actions", "manual")))
+# Sorted once for error messages (formatted as lists, as before).
+ALLOWED_TASK_TYPES_SORTED = sorted(ALLOWED_TASK_TYPES)
+ALLOWED_TASK_STATUSES_SORTED = sorted(ALLOWED_TASK_STATUSES)
+ALLOWED_PLATFORMS_SORTED = sorted(ALLOWED_PLATFORMS)
+ALLOWED_RUNNERS_SORTED = sorted(ALLOWED_RUNNERS)
+# Task types that run in their own worktree and therefore need a worktree and kickoff prompt.
+WORKTREE_TASK_TYPES = frozenset({"code", "test", "integration"})
+CODE_TEST_TASK_TYPES = frozenset({"code", "test"})
+REQUIRED_TASK_KEYS = (
+    "id",
+    "name",
+    "type",
+    "phase",
+    "status",
+    "description",
+    "references",
+    "acceptance_criteria",
+    "start_checklist",
+    "end_checklist",
+    "worktree",
+    "integration_task",
+    "kickoff_prompt",
+    "depends_on",
+    "concurrent_with",
+)
+REQUIRED_TASK_KEY_SET = frozenset(REQUIRED_TASK_KEYS)
+# Required fields fetched with one C-level call per task once the required-key check has passed.
+TASK_SCALAR_FIELDS = operator.itemgetter("id", "name", "phase", "description", "status", "worktree")
+TASK_LIST_FIELD_NAMES = ("references", "acceptance_criteria", "start_checklist", "end_checklist")
+TASK_LIST_FIELDS = operator.itemgetter(*TASK_LIST_FIELD_NAMES)
+TASK_DEP_FIELDS = operator.itemgetter("depends_on", "concurrent_with")
 DEFAULT_SCHEMA_VERSION = 1
-ALLOWED_WSL_TASK_MODES = {"bundled", "separate"}
+ALLOWED_WSL_TASK_MODES = frozenset({"bundled", "separate"})
+ALLOWED_WSL_TASK_MODES_SORTED = sorted(ALLOWED_WSL_TASK_MODES)
 AUTOMATION_SCHEMA_VERSION = 3
 WORKSTREAM_ID_RE = re.compile(r"^WS-[0-9]{6}-[a-z0-9_]+$")
 WORK_ITEM_ID_RE = re.compile(r"^WI-[0-9]{6}-[a-z0-9_]+$")
 PACK_ROOT_RE = re.compile(r"^docs/project_management/packs/[^/]+/[^/]+/?$")
 ADR_REF_RE = re.compile(r"^ADR-[0-9]{4}(?:-[a-z0-9_-]+)?$")
-
-
-@dataclass(frozen=True)
-class ValidationError:
+SMOKE_SCRIPT_BY_PLATFORM = {
+    "linux": "smoke/linux-smoke.sh",
+    "macos": "smoke/macos-smoke.sh",
+    "windows": "smoke/windows-smoke.ps1",
+}
+# Any of: --run-wsl, run_wsl (covers run_wsl=true), RUN_WSL=1, RUN_WSL=true.
+WSL_SMOKE_DISPATCH_RE = re.compile(r"--run-wsl|run_wsl|RUN_WSL=(?:1|true)")
+STR_TYPE = frozenset({str})
+# tasks.json files at least this large are memory-mapped for orjson instead of read into memory.
+MMAP_JSON_BYTES = 1024 * 1024
+# Integration task ids: <slice>-integ (final aggregator), <slice>-integ-core and
+# <slice>-integ-<platform>. Use with fullmatch; DOTALL keeps ids with odd characters matching.
+INTEG_TASK_ID_RE = re.compile(r"(?P<slice>.*)-integ(?:-(?P<platform>core|linux|macos|windows|wsl))?", re.DOTALL)
+
+
+class ValidationError(NamedTuple):
+    # A tuple subclass: immutable like the old frozen dataclass, but cheaper to create.
     message: str
 
 
 def _is_str_list(value: Any) -> bool:
-    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+    # JSON values are exact list/str instances; map(type, ...) keeps the item scan in C.
+    return type(value) is list and STR_TYPE.issuperset(map(type, value))
+
+
+def _is_nonempty_str(value: Any) -> bool:
+    # Parsed JSON strings are exact str instances, so skip the isinstance subclass walk.
+    return type(value) is str and value != ""
+
+
+def _str_items(task: Dict[str, Any], *fields: str) -> Iterator[str]:
+    # String entries of the given list fields, searched item by item instead of joined.
+    # Malformed fields are reported by _validate_tasks and skipped here.
+    for field in fields:
+        value = task.get(field)
+        if isinstance(value, list):
+            for item in value:
+                if isinstance(item, str):
+                    yield item
+
+
+def _file_names(dir_path: str, *, include_dirs: bool = False) -> Set[str]:
+    # Regular files (and, optionally, directories) directly under dir_path, following
+    # symlinks like os.path.isfile/exists: one scandir instead of one stat per name.
+    # Names match exactly, so callers treat a miss as "stat to be sure": on case-insensitive
+    # filesystems a differently-cased name still exists.
+    try:
+        with os.scandir(dir_path) as it:
+            return {entry.name for entry in it if entry.is_file() or (include_dirs and entry.is_dir())}
+    except OSError:
+        return set()
 
 
 def _read_json(path: str) -> Any:
-    with open(path, "r", encoding="utf-8") as handle:
+    # Parsed documents are shared between callers (and repeat calls), so treat them as read-only.
+    st = os.stat(path)
+    return _read_json_cached(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=128)
+def _read_json_cached(abs_path: str, mtime_ns: int, size: int) -> Any:
+    # mtime_ns/size are only part of the cache key: an edited file is parsed again.
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either.
+    if orjson is not None:
+        with open(abs_path, "rb") as handle:
+            if size < MMAP_JSON_BYTES:
+                return orjson.loads(handle.read())
+            # Large packs: parse straight from the page cache instead of copying into a bytes object.
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+    with open(abs_path, "r", encoding="utf-8") as handle:
         return json.load(handle)
 
 
+class _TooManyErrors(Exception):
+    pass
+
+
+class _ErrorBudget(list):
+    # An errors list that stops validation (via _TooManyErrors) once max_errors entries are recorded.
+    def __init__(self, max_errors: int) -> None:
+        super().__init__()
+        self.max_errors = max_errors
+
+
 def _error(errors: List[ValidationError], message: str) -> None:
-    errors.append(ValidationError(message=message))
+    errors.append(ValidationError(message))
+    if len(errors) == getattr(errors, "max_errors", 0):
+        raise _TooManyErrors
 
 
 def _duplicates(items: List[str]) -> List[str]:
@@ -51,7 +162,7 @@ def _duplicates(items: List[str]) -> List[str]:
             dupes.add(item)
         else:
             seen.add(item)
-    return sorted(dupes)
+    return sorted(dupes) if dupes else []
 
 
 def _repo_root_for_path(start_dir: str) -> Optional[str]:
@@ -66,15 +177,19 @@ def _repo_root_for_path(start_dir: str) -> Optional[str]:
     return out or None
 
 
+def _is_under(path_abs: str, root_abs: str) -> bool:
+    # Both paths absolute and normalized: True when path_abs is root_abs or inside it.
+    # Same answer as commonpath([path_abs, root_abs]) == root_abs, without re-splitting.
+    path_abs = os.path.normcase(path_abs)
+    root_abs = os.path.normcase(root_abs)
+    return path_abs == root_abs or path_abs.startswith(os.path.join(root_abs, ""))
+
+
 def _abspath_in_repo(repo_root: str, raw: str) -> str:
     repo_root_abs = os.path.abspath(repo_root)
     raw_path = raw.strip()
     abs_path = os.path.abspath(os.path.join(repo_root_abs, raw_path)) if not os.path.isabs(raw_path) else os.path.abspath(raw_path)
-    try:
-        common = os.path.commonpath([repo_root_abs, abs_path])
-    except Exception:
-        raise ValueError(f"path resolves outside repo root: {raw!r} -> {abs_path}")
-    if common != repo_root_abs:
+    if not _is_under(abs_path, repo_root_abs):
         raise ValueError(f"path resolves outside repo root: {raw!r} -> {abs_path}")
     return abs_path
 
@@ -134,12 +249,12 @@ def _validate_pm_external_tracking(
         if work_item_refs is None:
             # Back-compat: allow null (treated as empty).
             pass
-        elif not isinstance(work_item_refs, list) or not all(isinstance(x, str) for x in work_item_refs):
+        elif not _is_str_list(work_item_refs):
             _error(errors, f"{path}: meta.work_item_refs must be an array of strings when present")
         else:
-            bad = sorted({x for x in work_item_refs if not WORK_ITEM_ID_RE.match(x)})
+            bad = {x for x in work_item_refs if not WORK_ITEM_ID_RE.match(x)}
             if bad:
-                _error(errors, f"{path}: meta.work_item_refs contains invalid work item id(s): {', '.join(bad)} (expected {WORK_ITEM_ID_RE.pattern!r})")
+                _error(errors, f"{path}: meta.work_item_refs contains invalid work item id(s): {', '.join(sorted(bad))} (expected {WORK_ITEM_ID_RE.pattern!r})")
             dupes = _duplicates(work_item_refs)
             if dupes:
                 _error(errors, f"{path}: meta.work_item_refs contains duplicates: {', '.join(dupes)}")
@@ -165,7 +280,7 @@ def _validate_pm_external_tracking(
             v = raw.get(field, [])
             if v is None:
                 v = []
-            if not isinstance(v, list) or not all(isinstance(x, str) for x in v):
+            if not _is_str_list(v):
                 _error(errors, f"{path}: meta.{obj_name}.{field} must be an array of strings")
                 continue
 
@@ -173,9 +288,9 @@ def _validate_pm_external_tracking(
             if dupes:
                 _error(errors, f"{path}: meta.{obj_name}.{field} contains duplicates: {', '.join(dupes)}")
 
-            bad = sorted({x for x in v if not regex.match(x)})
+            bad = {x for x in v if not regex.match(x)}
             if bad:
-                _error(errors, f"{path}: meta.{obj_name}.{field} contains invalid {label}(s): {', '.join(bad)} (expected {regex.pattern!r})")
+                _error(errors, f"{path}: meta.{obj_name}.{field} contains invalid {label}(s): {', '.join(sorted(bad))} (expected {regex.pattern!r})")
 
             out[field] = v
         return out
@@ -278,15 +393,15 @@ def _validate_pm_external_tracking(
     adr_refs: Set[str] = set()
     raw_adr_refs = meta.get("adr_refs")
     if raw_adr_refs is not None:
-        if not isinstance(raw_adr_refs, list) or not all(isinstance(x, str) for x in raw_adr_refs):
+        if not _is_str_list(raw_adr_refs):
             _error(errors, f"{path}: meta.adr_refs must be an array of strings when present")
         else:
             dupes = _duplicates(raw_adr_refs)
             if dupes:
                 _error(errors, f"{path}: meta.adr_refs contains duplicates: {', '.join(dupes)}")
-            bad = sorted({x for x in raw_adr_refs if not ADR_REF_RE.match(x)})
+            bad = {x for x in raw_adr_refs if not ADR_REF_RE.match(x)}
             if bad:
-                _error(errors, f"{path}: meta.adr_refs contains invalid ADR ref(s): {', '.join(bad)} (expected {ADR_REF_RE.pattern!r})")
+                _error(errors, f"{path}: meta.adr_refs contains invalid ADR ref(s): {', '.join(sorted(bad))} (expected {ADR_REF_RE.pattern!r})")
             for x in raw_adr_refs:
                 if ADR_REF_RE.match(x):
                     adr_refs.add(x)
@@ -339,6 +454,8 @@ def _validate_meta(data: Any, errors: List[ValidationError], path: str) -> Dict[
     if not isinstance(meta, dict):
         _error(errors, f"{path}: meta must be an object when present")
         return {}
+    # Legacy aliases and defaults are filled in below; keep them off the (cached) document.
+    meta = dict(meta)
 
     schema_version = meta.get("schema_version", DEFAULT_SCHEMA_VERSION)
     if not isinstance(schema_version, int) or schema_version < 1:
@@ -348,21 +465,21 @@ def _validate_meta(data: Any, errors: List[ValidationError], path: str) -> Dict[
         value = meta.get(field)
         if value is None:
             return None
-        if not isinstance(value, list) or not all(isinstance(p, str) for p in value):
+        if not _is_str_list(value):
             _error(errors, f"{path}: meta.{field} must be an array of strings")
             return None
-        allowed = set(ALLOWED_PLATFORMS_REQUIRED)
-        if allow_wsl:
-            allowed = set(ALLOWED_PLATFORMS)
-        unknown = sorted({p for p in value if p not in allowed})
-        if unknown:
+        allowed = ALLOWED_PLATFORMS if allow_wsl else ALLOWED_PLATFORMS_REQUIRED
+        # Sorted only when there is something to report; the common case has no unknowns.
+        unknown_set = set(value).difference(allowed)
+        if unknown_set:
+            unknown = sorted(unknown_set)
             _error(errors, f"{path}: meta.{field} contains unknown platform(s): {', '.join(unknown)}")
             if not allow_wsl and "wsl" in unknown:
                 _error(
                     errors,
                     f"{path}: do not include 'wsl' in meta.{field}; use meta.wsl_required=true and meta.wsl_task_mode='bundled'|'separate'",
                 )
-        duplicates = sorted({p for p in value if value.count(p) > 1})
+        duplicates = _duplicates(value)
         if duplicates:
             _error(errors, f"{path}: meta.{field} contains duplicate platform(s): {', '.join(duplicates)}")
         return value
@@ -389,7 +506,7 @@ def _validate_meta(data: Any, errors: List[ValidationError], path: str) -> Dict[
     wsl_task_mode = meta.get("wsl_task_mode")
     if wsl_task_mode is not None:
         if not isinstance(wsl_task_mode, str) or wsl_task_mode not in ALLOWED_WSL_TASK_MODES:
-            _error(errors, f"{path}: meta.wsl_task_mode must be one of {sorted(ALLOWED_WSL_TASK_MODES)} when present")
+            _error(errors, f"{path}: meta.wsl_task_mode must be one of {ALLOWED_WSL_TASK_MODES_SORTED} when present")
         if wsl_required is not True:
             _error(errors, f"{path}: meta.wsl_task_mode requires meta.wsl_required=true")
 
@@ -409,53 +526,67 @@ def _validate_meta(data: Any, errors: List[ValidationError], path: str) -> Dict[
 
 
 def _validate_execution_gates(
-    feature_dir: str, tasks: List[Dict[str, Any]], meta: Dict[str, Any], errors: List[ValidationError], path: str
+    feature_dir: str,
+    tasks_by_id: Dict[str, Dict[str, Any]],
+    meta: Dict[str, Any],
+    errors: List[ValidationError],
+    path: str,
 ) -> None:
     if meta.get("execution_gates") is not True:
         return
 
+    feature_files = _file_names(feature_dir)
     preflight_report = os.path.join(feature_dir, "execution_preflight_report.md")
-    if not os.path.isfile(preflight_report):
+    if "execution_preflight_report.md" not in feature_files and not os.path.isfile(preflight_report):
         _error(errors, f"{path}: meta.execution_gates=true requires {preflight_report!r} to exist")
 
-    tasks_by_id: Dict[str, Dict[str, Any]] = {t.get("id"): t for t in tasks if isinstance(t.get("id"), str)}
     preflight_task = tasks_by_id.get("F0-exec-preflight")
     if preflight_task is None:
         _error(errors, f"{path}: meta.execution_gates=true requires a task with id 'F0-exec-preflight'")
     else:
         if preflight_task.get("type") != "ops":
             _error(errors, f"{path}: 'F0-exec-preflight' must have type='ops'")
-        txt = "\n".join(preflight_task.get("references", []) + preflight_task.get("start_checklist", []) + preflight_task.get("end_checklist", []))
-        if "execution_preflight_report.md" not in txt:
+        if not any(
+            "execution_preflight_report.md" in item
+            for item in _str_items(preflight_task, "references", "start_checklist", "end_checklist")
+        ):
             _error(errors, f"{path}: 'F0-exec-preflight' must reference execution_preflight_report.md")
 
     # Per-slice closeout reports: require <SLICE>-closeout_report.md and linkage from <SLICE>-integ.
     slice_ids: Set[str] = set()
     for task_id, task in tasks_by_id.items():
-        if not isinstance(task_id, str):
-            continue
         if task.get("type") != "integration":
             continue
-        if task_id.endswith("-integ") and not task_id.endswith("-integ-core"):
-            slice_ids.add(task_id[: -len("-integ")])
+        match = INTEG_TASK_ID_RE.fullmatch(task_id)
+        if match is not None and match["platform"] is None:
+            slice_ids.add(match["slice"])
 
     for slice_id in sorted(slice_ids):
-        closeout_legacy = os.path.join(feature_dir, f"{slice_id}-closeout_report.md")
-        closeout_slices = os.path.join(feature_dir, "slices", slice_id, f"{slice_id}-closeout_report.md")
-        if not os.path.isfile(closeout_legacy) and not os.path.isfile(closeout_slices):
+        closeout_name = f"{slice_id}-closeout_report.md"
+        closeout_legacy = os.path.join(feature_dir, closeout_name)
+        closeout_slices = os.path.join(feature_dir, "slices", slice_id, closeout_name)
+        if (
+            closeout_name not in feature_files
+            and not os.path.isfile(closeout_legacy)
+            and not os.path.isfile(closeout_slices)
+        ):
             _error(errors, f"{path}: meta.execution_gates=true requires {closeout_legacy!r} or {closeout_slices!r} to exist")
 
         final_id = f"{slice_id}-integ"
         final_task = tasks_by_id.get(final_id)
         if final_task is None:
             continue
-        txt = "\n".join(final_task.get("references", []) + final_task.get("end_checklist", []))
-        if f"{slice_id}-closeout_report.md" not in txt:
+        if not any(closeout_name in item for item in _str_items(final_task, "references", "end_checklist")):
             _error(errors, f"{path}: {final_id!r} must reference {slice_id}-closeout_report.md in references/end_checklist")
 
 
 def _validate_task_automation(
-    feature_dir: str, tasks: List[Dict[str, Any]], meta: Dict[str, Any], errors: List[ValidationError], path: str
+    feature_dir: str,
+    tasks: List[Dict[str, Any]],
+    tasks_by_id: Dict[str, Dict[str, Any]],
+    meta: Dict[str, Any],
+    errors: List[ValidationError],
+    path: str,
 ) -> None:
     """
     Enforce the triad automation shape only when explicitly opted in:
@@ -489,8 +620,6 @@ def _validate_task_automation(
             f"{path}: meta.schema_version >= {AUTOMATION_SCHEMA_VERSION} requires meta.automation.orchestration_branch to be a non-empty string",
         )
 
-    tasks_by_id: Dict[str, Dict[str, Any]] = {t.get("id"): t for t in tasks if isinstance(t.get("id"), str)}
-
     # Feature-level cleanup task (required for worktree retention model).
     cleanup = tasks_by_id.get("FZ-feature-cleanup")
     if cleanup is None:
@@ -504,8 +633,8 @@ def _validate_task_automation(
         if not isinstance(kickoff, str) or not kickoff:
             _error(errors, f"{path}: 'FZ-feature-cleanup' must have a kickoff_prompt path")
         else:
-            expected_prefix = os.path.join(feature_dir, "kickoff_prompts")
-            if os.path.commonpath([os.path.abspath(kickoff), os.path.abspath(expected_prefix)]) != os.path.abspath(expected_prefix):
+            expected_prefix = os.path.abspath(os.path.join(feature_dir, "kickoff_prompts"))
+            if not _is_under(os.path.abspath(kickoff), expected_prefix):
                 _error(errors, f"{path}: 'FZ-feature-cleanup' kickoff_prompt must live under feature_dir/kickoff_prompts")
 
     # Per-task structured automation fields.
@@ -516,7 +645,7 @@ def _validate_task_automation(
             continue
 
         task_type = task.get("type")
-        if task_type not in {"code", "test", "integration"}:
+        if task_type not in WORKTREE_TASK_TYPES:
             continue
 
         prefix = f"{path}:tasks[{index}]({task_id})"
@@ -538,14 +667,14 @@ def _validate_task_automation(
             if not isinstance(merge_to_orch, bool):
                 _error(errors, f"{prefix}.merge_to_orchestration: required boolean for integration tasks in automation packs")
 
-    duplicates = {b for b in branches if branches.count(b) > 1}
+    duplicates = _duplicates(branches)
     if duplicates:
-        _error(errors, f"{path}: duplicate git_branch values (must be unique): {', '.join(sorted(duplicates))}")
+        _error(errors, f"{path}: duplicate git_branch values (must be unique): {', '.join(duplicates)}")
 
     # Parallel code/test pairing is required for automation packs so the pair launcher can be used
     # deterministically and without ad-hoc task selection.
     for code_id, code_task in tasks_by_id.items():
-        if not isinstance(code_id, str) or not code_id.endswith("-code"):
+        if not code_id.endswith("-code"):
             continue
         if code_task.get("type") != "code":
             _error(errors, f"{path}: {code_id!r} ends with '-code' but has type={code_task.get('type')!r}")
@@ -575,227 +704,223 @@ def _validate_task_automation(
             )
 
 
-def _validate_task_fields(tasks: List[Dict[str, Any]], errors: List[ValidationError], path: str) -> None:
-    required = [
-        "id",
-        "name",
-        "type",
-        "phase",
-        "status",
-        "description",
-        "references",
-        "acceptance_criteria",
-        "start_checklist",
-        "end_checklist",
-        "worktree",
-        "integration_task",
-        "kickoff_prompt",
-        "depends_on",
-        "concurrent_with",
-    ]
-
-    ids: List[str] = []
+def _validate_tasks(
+    feature_dir: str,
+    tasks: List[Dict[str, Any]],
+    tasks_by_id: Dict[str, Dict[str, Any]],
+    external_task_ids: Set[str],
+    errors: List[ValidationError],
+    path: str,
+) -> None:
+    # Per-task field and reference checks in one walk over tasks. Reference errors are
+    # collected separately and appended after the field errors, so output order is unchanged.
+    ref_errors: List[ValidationError] = []
+    seen_ids: Set[str] = set()
+    duplicate_ids: Set[str] = set()
+    # os.path.abspath calls getcwd() each time; resolve kickoff prompts against one lookup.
+    cwd = os.getcwd()
+    kickoff_dir = os.path.normpath(os.path.join(cwd, feature_dir, "kickoff_prompts"))
+    slices_root = os.path.normpath(os.path.join(cwd, feature_dir, "slices"))
+    # Kickoff prompts mostly share a directory or two; list each once.
+    dir_listings: Dict[str, Set[str]] = {}
+
+    def _exists(raw: str) -> bool:
+        head, tail = os.path.split(raw)
+        if tail in ("", os.curdir, os.pardir):
+            return os.path.exists(raw)
+        names = dir_listings.get(head)
+        if names is None:
+            names = dir_listings[head] = _file_names(head or os.curdir, include_dirs=True)
+        return tail in names or os.path.exists(raw)
+
     for index, task in enumerate(tasks):
         prefix = f"{path}:tasks[{index}]"
+        ref_prefix = f"{prefix}({task.get('id', '<missing id>')})"
+        task_type = task.get("type")
+        if type(task_type) is str:
+            # Compared against the type vocabulary several times below; interned, those
+            # comparisons match on identity instead of comparing characters.
+            task_type = sys.intern(task_type)
+        integration_task_value = task.get("integration_task")
+        kickoff_prompt_value = task.get("kickoff_prompt")
+
+        # References: these also run for tasks that are missing required keys.
+        if isinstance(kickoff_prompt_value, str):
+            if not _exists(kickoff_prompt_value):
+                _error(ref_errors, f"{ref_prefix}.kickoff_prompt: file does not exist: {kickoff_prompt_value!r}")
+            else:
+                kickoff_prompt_abs = os.path.normpath(os.path.join(cwd, kickoff_prompt_value))
+                under_feature_kickoff = _is_under(kickoff_prompt_abs, kickoff_dir)
+                under_slice_kickoff = False
+
+                if not under_feature_kickoff:
+                    if _is_under(kickoff_prompt_abs, slices_root):
+                        rel = os.path.relpath(kickoff_prompt_abs, slices_root)
+                        parts = [p for p in rel.replace("\\", "/").split("/") if p]
+                        if len(parts) >= 3 and parts[1] == "kickoff_prompts":
+                            under_slice_kickoff = True
+
+                if not under_feature_kickoff and not under_slice_kickoff:
+                    _error(
+                        ref_errors,
+                        f"{ref_prefix}.kickoff_prompt: must live under feature_dir/kickoff_prompts or "
+                        f"feature_dir/slices/<slice>/kickoff_prompts: {kickoff_prompt_value!r}",
+                    )
+
+        for dep in task.get("depends_on", []):
+            if dep in tasks_by_id or dep in external_task_ids:
+                continue
+            _error(
+                ref_errors,
+                f"{ref_prefix}.depends_on: unknown task id {dep!r} (if external, add it to tasks.json meta.external_task_ids)",
+            )
+        for other in task.get("concurrent_with", []):
+            if other in tasks_by_id or other in external_task_ids:
+                continue
+            _error(
+                ref_errors,
+                f"{ref_prefix}.concurrent_with: unknown task id {other!r} (if external, add it to tasks.json meta.external_task_ids)",
+            )
+
+        if task_type == "integration":
+            if _is_nonempty_str(integration_task_value) and integration_task_value != task.get("id"):
+                _error(
+                    ref_errors,
+                    f"{ref_prefix}.integration_task: integration tasks should set integration_task to their own id",
+                )
+        elif task_type in CODE_TEST_TASK_TYPES:
+            if not _is_nonempty_str(integration_task_value):
+                _error(ref_errors, f"{ref_prefix}.integration_task: must be a non-empty string")
+            elif integration_task_value in tasks_by_id:
+                integration_type = tasks_by_id[integration_task_value].get("type")
+                if integration_type != "integration":
+                    _error(
+                        ref_errors,
+                        f"{ref_prefix}.integration_task: {integration_task_value!r} must reference a task with type=integration",
+                    )
+            else:
+                _error(ref_errors, f"{ref_prefix}.integration_task: unknown task id {integration_task_value!r}")
 
-        missing = [key for key in required if key not in task]
-        if missing:
+        # Fields. One C-level subset test per task; the ordered list is only built on failure.
+        if not REQUIRED_TASK_KEY_SET <= task.keys():
+            missing = [key for key in REQUIRED_TASK_KEYS if key not in task]
             _error(errors, f"{prefix}: missing required keys: {', '.join(missing)}")
             continue
 
-        if not isinstance(task["id"], str) or not task["id"]:
+        task_id, name, phase, description, status, worktree_value = TASK_SCALAR_FIELDS(task)
+        if not _is_nonempty_str(task_id):
             _error(errors, f"{prefix}.id: must be a non-empty string")
+        elif task_id in seen_ids:
+            duplicate_ids.add(task_id)
         else:
-            ids.append(task["id"])
+            seen_ids.add(task_id)
 
-        if not isinstance(task["name"], str) or not task["name"]:
+        if not _is_nonempty_str(name):
             _error(errors, f"{prefix}.name: must be a non-empty string")
-        if not isinstance(task["phase"], str) or not task["phase"]:
+        if not _is_nonempty_str(phase):
             _error(errors, f"{prefix}.phase: must be a non-empty string")
-        if not isinstance(task["description"], str) or not task["description"]:
+        if not _is_nonempty_str(description):
             _error(errors, f"{prefix}.description: must be a non-empty string")
 
-        task_type = task["type"]
         if task_type not in ALLOWED_TASK_TYPES:
-            _error(errors, f"{prefix}.type: must be one of {sorted(ALLOWED_TASK_TYPES)}, got {task_type!r}")
+            _error(errors, f"{prefix}.type: must be one of {ALLOWED_TASK_TYPES_SORTED}, got {task_type!r}")
 
-        status = task["status"]
         if status not in ALLOWED_TASK_STATUSES:
-            _error(errors, f"{prefix}.status: must be one of {sorted(ALLOWED_TASK_STATUSES)}, got {status!r}")
-
-        if not _is_str_list(task["references"]):
-            _error(errors, f"{prefix}.references: must be an array of strings")
-        if not _is_str_list(task["acceptance_criteria"]):
-            _error(errors, f"{prefix}.acceptance_criteria: must be an array of strings")
-        if not _is_str_list(task["start_checklist"]):
-            _error(errors, f"{prefix}.start_checklist: must be an array of strings")
-        if not _is_str_list(task["end_checklist"]):
-            _error(errors, f"{prefix}.end_checklist: must be an array of strings")
-
-        task_type = task["type"]
-
-        worktree_value = task["worktree"]
-        if task_type in {"code", "test", "integration"}:
-            if not isinstance(worktree_value, str) or not worktree_value:
+            _error(errors, f"{prefix}.status: must be one of {ALLOWED_TASK_STATUSES_SORTED}, got {status!r}")
+
+        for field, value in zip(TASK_LIST_FIELD_NAMES, TASK_LIST_FIELDS(task)):
+            if not _is_str_list(value):
+                _error(errors, f"{prefix}.{field}: must be an array of strings")
+
+        needs_worktree = task_type in WORKTREE_TASK_TYPES
+
+        if needs_worktree:
+            if not _is_nonempty_str(worktree_value):
                 _error(errors, f"{prefix}.worktree: must be a non-empty string (recommended: starts with `wt/`)")
         else:
-            if worktree_value is not None and (not isinstance(worktree_value, str) or not worktree_value):
+            if worktree_value is not None and not _is_nonempty_str(worktree_value):
                 _error(errors, f"{prefix}.worktree: must be null or a non-empty string")
 
-        integration_task_value = task["integration_task"]
         if task_type == "integration":
             if integration_task_value is None:
                 pass
             elif not isinstance(integration_task_value, str):
                 _error(errors, f"{prefix}.integration_task: must be a string or null for integration tasks")
-        elif task_type in {"code", "test"}:
-            if not isinstance(integration_task_value, str) or not integration_task_value:
+        elif task_type in CODE_TEST_TASK_TYPES:
+            if not _is_nonempty_str(integration_task_value):
                 _error(errors, f"{prefix}.integration_task: must be a non-empty string")
         else:
-            if integration_task_value is not None and (not isinstance(integration_task_value, str) or not integration_task_value):
+            if integration_task_value is not None and not _is_nonempty_str(integration_task_value):
                 _error(errors, f"{prefix}.integration_task: must be null or a non-empty string")
 
-        kickoff_prompt_value = task["kickoff_prompt"]
-        if task_type in {"code", "test", "integration"}:
-            if not isinstance(kickoff_prompt_value, str) or not kickoff_prompt_value:
+        if needs_worktree:
+            if not _is_nonempty_str(kickoff_prompt_value):
                 _error(errors, f"{prefix}.kickoff_prompt: must be a non-empty string path")
         else:
-            if kickoff_prompt_value is not None and (not isinstance(kickoff_prompt_value, str) or not kickoff_prompt_value):
+            if kickoff_prompt_value is not None and not _is_nonempty_str(kickoff_prompt_value):
                 _error(errors, f"{prefix}.kickoff_prompt: must be null or a non-empty string path")
 
-        if not _is_str_list(task["depends_on"]):
+        depends_on, concurrent_with = TASK_DEP_FIELDS(task)
+        if not _is_str_list(depends_on):
             _error(errors, f"{prefix}.depends_on: must be an array of strings")
-        if not _is_str_list(task["concurrent_with"]):
+        if not _is_str_list(concurrent_with):
             _error(errors, f"{prefix}.concurrent_with: must be an array of strings")
 
         platform = task.get("platform")
         if platform is not None and platform not in ALLOWED_PLATFORMS:
-            _error(errors, f"{prefix}.platform: must be one of {sorted(ALLOWED_PLATFORMS)}, got {platform!r}")
+            _error(errors, f"{prefix}.platform: must be one of {ALLOWED_PLATFORMS_SORTED}, got {platform!r}")
 
         runner = task.get("runner")
         if runner is not None and runner not in ALLOWED_RUNNERS:
-            _error(errors, f"{prefix}.runner: must be one of {sorted(ALLOWED_RUNNERS)}, got {runner!r}")
+            _error(errors, f"{prefix}.runner: must be one of {ALLOWED_RUNNERS_SORTED}, got {runner!r}")
 
-    duplicates = {task_id for task_id in ids if ids.count(task_id) > 1}
-    if duplicates:
-        _error(errors, f"{path}: duplicate task ids: {', '.join(sorted(duplicates))}")
+    if duplicate_ids:
+        _error(errors, f"{path}: duplicate task ids: {', '.join(sorted(duplicate_ids))}")
+    errors.extend(ref_errors)
+    if 0 < getattr(errors, "max_errors", 0) <= len(errors):
+        raise _TooManyErrors
 
 
-def _validate_references(
+def _validate_smoke_linkage(
     feature_dir: str,
     tasks: List[Dict[str, Any]],
-    external_task_ids: Set[str],
+    meta: Dict[str, Any],
     errors: List[ValidationError],
     path: str,
 ) -> None:
-    all_task_ids: Set[str] = {task.get("id") for task in tasks if isinstance(task.get("id"), str)}
-    tasks_by_id: Dict[str, Dict[str, Any]] = {task["id"]: task for task in tasks if isinstance(task.get("id"), str)}
-    kickoff_dir = os.path.abspath(os.path.join(feature_dir, "kickoff_prompts"))
-    slices_root = os.path.abspath(os.path.join(feature_dir, "slices"))
-
-    for index, task in enumerate(tasks):
-        prefix = f"{path}:tasks[{index}]({task.get('id', '<missing id>')})"
-
-        kickoff_prompt = task.get("kickoff_prompt")
-        if isinstance(kickoff_prompt, str):
-            if not os.path.exists(kickoff_prompt):
-                _error(errors, f"{prefix}.kickoff_prompt: file does not exist: {kickoff_prompt!r}")
-            else:
-                kickoff_prompt_abs = os.path.abspath(kickoff_prompt)
-                under_feature_kickoff = os.path.commonpath([kickoff_prompt_abs, kickoff_dir]) == kickoff_dir
-                under_slice_kickoff = False
-
-                if not under_feature_kickoff:
-                    try:
-                        under_slices_root = os.path.commonpath([kickoff_prompt_abs, slices_root]) == slices_root
-                    except ValueError:
-                        under_slices_root = False
-                    if under_slices_root:
-                        rel = os.path.relpath(kickoff_prompt_abs, slices_root)
-                        parts = [p for p in rel.replace("\\", "/").split("/") if p]
-                        if len(parts) >= 3 and parts[1] == "kickoff_prompts":
-                            under_slice_kickoff = True
-
-                if not under_feature_kickoff and not under_slice_kickoff:
-                    _error(
-                        errors,
-                        f"{prefix}.kickoff_prompt: must live under feature_dir/kickoff_prompts or "
-                        f"feature_dir/slices/<slice>/kickoff_prompts: {kickoff_prompt!r}",
-                    )
-
-        for dep in task.get("depends_on", []):
-            if dep in all_task_ids or dep in external_task_ids:
-                continue
-            _error(
-                errors,
-                f"{prefix}.depends_on: unknown task id {dep!r} (if external, add it to tasks.json meta.external_task_ids)",
-            )
-        for other in task.get("concurrent_with", []):
-            if other in all_task_ids or other in external_task_ids:
-                continue
-            _error(
-                errors,
-                f"{prefix}.concurrent_with: unknown task id {other!r} (if external, add it to tasks.json meta.external_task_ids)",
-            )
-
-        integration_task = task.get("integration_task")
-        task_type = task.get("type")
-        if task_type == "integration":
-            if not isinstance(integration_task, str) or not integration_task:
-                continue
-            if integration_task != task.get("id"):
-                _error(errors, f"{prefix}.integration_task: integration tasks should set integration_task to their own id")
-            continue
-
-        if task_type not in {"code", "test"}:
-            continue
-
-        if not isinstance(integration_task, str) or not integration_task:
-            _error(errors, f"{prefix}.integration_task: must be a non-empty string")
-        elif integration_task in tasks_by_id:
-            integration_type = tasks_by_id[integration_task].get("type")
-            if integration_type != "integration":
-                _error(errors, f"{prefix}.integration_task: {integration_task!r} must reference a task with type=integration")
-        else:
-            _error(errors, f"{prefix}.integration_task: unknown task id {integration_task!r}")
-
-
-def _validate_smoke_linkage(feature_dir: str, tasks: List[Dict[str, Any]], errors: List[ValidationError], path: str) -> None:
     smoke_dir = os.path.join(feature_dir, "smoke")
     if not os.path.isdir(smoke_dir):
         return
 
     # Smoke scripts are required only for behavior platforms (P3-008).
-    tasks_json = os.path.join(feature_dir, "tasks.json")
-    data = _read_json(tasks_json)
-    meta = _validate_meta(data, [], tasks_json)
     behavior_platforms = meta.get("behavior_platforms_required") or meta.get("ci_parity_platforms_required") or meta.get("platforms_required") or []
 
-    platform_to_smoke = {
-        "linux": "smoke/linux-smoke.sh",
-        "macos": "smoke/macos-smoke.sh",
-        "windows": "smoke/windows-smoke.ps1",
-    }
-
-    required_smoke_paths = [platform_to_smoke[p] for p in behavior_platforms if p in platform_to_smoke]
+    required_smoke_paths = [SMOKE_SCRIPT_BY_PLATFORM[p] for p in behavior_platforms if p in SMOKE_SCRIPT_BY_PLATFORM]
     if not required_smoke_paths:
         return
 
-    integration_text = "\n".join(
-        "\n".join((t.get("id") or "",) + tuple(t.get("references", []) + t.get("end_checklist", [])))
-        for t in tasks
-        if t.get("type") == "integration"
-    )
+    integration_items: List[str] = []
+    for t in tasks:
+        if t.get("type") != "integration":
+            continue
+        task_id = t.get("id")
+        if isinstance(task_id, str):
+            integration_items.append(task_id)
+        integration_items.extend(_str_items(t, "references", "end_checklist"))
 
     for smoke_path in required_smoke_paths:
-        if smoke_path not in integration_text:
+        if not any(smoke_path in item for item in integration_items):
             _error(
                 errors,
                 f"{path}: missing integration references to required smoke script {smoke_path!r} (behavior platforms={behavior_platforms})",
             )
 
 def _validate_platform_integ_model(
-    feature_dir: str, tasks: List[Dict[str, Any]], meta: Dict[str, Any], errors: List[ValidationError], path: str
+    feature_dir: str,
+    tasks_by_id: Dict[str, Dict[str, Any]],
+    meta: Dict[str, Any],
+    errors: List[ValidationError],
+    path: str,
 ) -> None:
     """
     Enforce the cross-platform (platform-fix) integration structure for cross-platform planning packs.
@@ -847,9 +972,8 @@ def _validate_platform_integ_model(
     if wsl_required and wsl_task_mode == "separate":
         effective_platform_tasks.append("wsl")
 
-    tasks_by_id: Dict[str, Dict[str, Any]] = {t.get("id"): t for t in tasks if isinstance(t.get("id"), str)}
-    automation_enabled = isinstance(meta.get("automation"), dict) and meta.get("automation", {}).get("enabled") is True
-
+    automation = meta.get("automation")
+    automation_enabled = isinstance(automation, dict) and automation.get("enabled") is True
     # Determine slices present by looking for final aggregator integration tasks (X-integ).
     # This makes the validator fail loudly when a cross-platform pack only defines a single
     # per-slice integration task and omits the required core + per-platform tasks.
@@ -857,14 +981,11 @@ def _validate_platform_integ_model(
     for task_id, task in tasks_by_id.items():
         if task.get("type") != "integration":
             continue
-        if not isinstance(task_id, str) or not task_id.endswith("-integ"):
-            continue
-        if task_id.endswith("-integ-core"):
-            continue
-        # Exclude platform-fix tasks which are *not* final aggregators.
-        if any(task_id.endswith(f"-integ-{p}") for p in effective_platform_tasks):
+        # Core and platform-fix tasks are *not* final aggregators.
+        match = INTEG_TASK_ID_RE.fullmatch(task_id)
+        if match is None or match["platform"] is not None:
             continue
-        slices.add(task_id[: -len("-integ")])
+        slices.add(match["slice"])
 
     if not slices:
         _error(
@@ -878,19 +999,18 @@ def _validate_platform_integ_model(
         if not isinstance(boundaries, list) or not all(isinstance(x, str) and x for x in boundaries):
             _error(errors, f"{path}: meta.schema_version>=4 with meta.cross_platform=true requires meta.checkpoint_boundaries to be an array of non-empty strings")
             return
-        if len(set(boundaries)) != len(boundaries):
+        boundary_set: Set[str] = set(boundaries)
+        if len(boundary_set) != len(boundaries):
             _error(errors, f"{path}: meta.checkpoint_boundaries contains duplicates")
             return
-        unknown = sorted(set(boundaries) - set(slices))
-        if unknown:
-            _error(errors, f"{path}: meta.checkpoint_boundaries contains slice ids not present in tasks.json: {', '.join(unknown)}")
+        unknown_set = boundary_set.difference(slices)
+        if unknown_set:
+            _error(errors, f"{path}: meta.checkpoint_boundaries contains slice ids not present in tasks.json: {', '.join(sorted(unknown_set))}")
             return
         if not boundaries:
             _error(errors, f"{path}: meta.checkpoint_boundaries must be non-empty for schema v4 cross-platform packs")
             return
 
-        boundary_set: Set[str] = set(boundaries)
-
         for slice_id in sorted(slices):
             code_id = f"{slice_id}-code"
             test_id = f"{slice_id}-test"
@@ -991,13 +1111,8 @@ def _validate_platform_integ_model(
 
                 # Bundled WSL: require the Linux platform task to include WSL smoke.
                 if wsl_required and wsl_task_mode == "bundled" and platform == "linux":
-                    txt = "\n".join(platform_task.get("references", []) + platform_task.get("end_checklist", []))
-                    if (
-                        "--run-wsl" not in txt
-                        and "run_wsl=true" not in txt
-                        and "run_wsl" not in txt
-                        and "RUN_WSL=1" not in txt
-                        and "RUN_WSL=true" not in txt
+                    if not any(
+                        WSL_SMOKE_DISPATCH_RE.search(item) for item in _str_items(platform_task, "references", "end_checklist")
                     ):
                         _error(
                             errors,
@@ -1103,13 +1218,8 @@ def _validate_platform_integ_model(
 
             # Bundled WSL: require the Linux platform task to include WSL smoke.
             if wsl_required and wsl_task_mode == "bundled" and platform == "linux":
-                txt = "\n".join(platform_task.get("references", []) + platform_task.get("end_checklist", []))
-                if (
-                    "--run-wsl" not in txt
-                    and "run_wsl=true" not in txt
-                    and "run_wsl" not in txt
-                    and "RUN_WSL=1" not in txt
-                    and "RUN_WSL=true" not in txt
+                if not any(
+                    WSL_SMOKE_DISPATCH_RE.search(item) for item in _str_items(platform_task, "references", "end_checklist")
                 ):
                     _error(
                         errors,
@@ -1128,39 +1238,55 @@ def _validate_platform_integ_model(
                 _error(errors, f"{path}: {final_id!r} depends_on must include {platform_id!r}")
 
 
-def validate_tasks_json(feature_dir: str) -> Tuple[List[ValidationError], str]:
-    tasks_path = os.path.join(feature_dir, "tasks.json")
-    errors: List[ValidationError] = []
-
+def _validate_feature_dir(feature_dir: str, tasks_path: str, errors: List[ValidationError]) -> None:
     if not os.path.isfile(tasks_path):
         _error(errors, f"{tasks_path}: missing")
-        return errors, tasks_path
+        return
 
     try:
         data = _read_json(tasks_path)
     except json.JSONDecodeError as exc:
         _error(errors, f"{tasks_path}: invalid JSON: {exc}")
-        return errors, tasks_path
+        return
 
     meta = _validate_meta(data, errors, tasks_path)
     _validate_pm_external_tracking(feature_dir, meta, errors, tasks_path)
 
     tasks = _validate_tasks_shape(data, errors, tasks_path)
     if tasks is None:
-        return errors, tasks_path
+        return
+
+    external_task_ids: Set[str] = set()
+    if isinstance(meta, dict):
+        # Keep the valid ids even when some entries are bad, so references to them still resolve.
+        external_task_ids = set(_str_items(meta, "external_task_ids"))
+        external_list = meta.get("external_task_ids", [])
+        if isinstance(external_list, list) and not _is_str_list(external_list):
+            _error(errors, f"{tasks_path}: meta.external_task_ids must be an array of strings")
+
+    # Built once and shared by the cross-task checks; for duplicate ids the last task wins.
+    tasks_by_id: Dict[str, Dict[str, Any]] = {
+        task_id: t for t in tasks if isinstance(task_id := t.get("id"), str)
+    }
 
-    external_list = meta.get("external_task_ids", []) if isinstance(meta, dict) else []
-    external_task_ids: Set[str] = set(external_list) if isinstance(external_list, list) else set()
-    if not all(isinstance(x, str) for x in external_task_ids):
-        _error(errors, f"{tasks_path}: meta.external_task_ids must be an array of strings")
+    _validate_tasks(feature_dir, tasks, tasks_by_id, external_task_ids, errors, tasks_path)
+    _validate_smoke_linkage(feature_dir, tasks, meta, errors, tasks_path)
+    _validate_platform_integ_model(feature_dir, tasks_by_id, meta, errors, tasks_path)
+    _validate_execution_gates(feature_dir, tasks_by_id, meta, errors, tasks_path)
+    _validate_task_automation(feature_dir, tasks, tasks_by_id, meta, errors, tasks_path)
 
-    _validate_task_fields(tasks, errors, tasks_path)
-    _validate_references(feature_dir, tasks, external_task_ids, errors, tasks_path)
-    _validate_smoke_linkage(feature_dir, tasks, errors, tasks_path)
-    _validate_platform_integ_model(feature_dir, tasks, meta, errors, tasks_path)
-    _validate_execution_gates(feature_dir, tasks, meta, errors, tasks_path)
-    _validate_task_automation(feature_dir, tasks, meta, errors, tasks_path)
 
+def validate_tasks_json(feature_dir: str, max_errors: int = 0) -> Tuple[List[ValidationError], str]:
+    # max_errors > 0 stops at the first max_errors errors instead of collecting all of them.
+    tasks_path = os.path.join(feature_dir, "tasks.json")
+    errors: List[ValidationError] = _ErrorBudget(max_errors) if max_errors > 0 else []
+    try:
+        _validate_feature_dir(feature_dir, tasks_path, errors)
+    except _TooManyErrors:
+        pass
+    if max_errors > 0:
+        # Reference errors are appended in bulk after the task pass and can overshoot the budget.
+        del errors[max_errors:]
     return errors, tasks_path
 
 
@@ -1171,13 +1297,21 @@ def main() -> int:
         required=True,
         help="Feature Planning Pack directory under docs/project_management/(next|packs/<bucket>)/<feature>",
     )
+    parser.add_argument(
+        "--max-errors",
+        type=int,
+        default=0,
+        help="Stop after this many errors (default: 0, report every error)",
+    )
     args = parser.parse_args()
 
     feature_dir = args.feature_dir.rstrip("/").rstrip("\\")
-    errors, tasks_path = validate_tasks_json(feature_dir=feature_dir)
+    errors, tasks_path = validate_tasks_json(feature_dir=feature_dir, max_errors=args.max_errors)
     if errors:
         for err in errors:
             print(err.message, file=sys.stderr)
+        if args.max_errors > 0 and len(errors) >= args.max_errors:
+            print(f"NOTE: --max-errors {args.max_errors} reached; further errors may be unreported", file=sys.stderr)
         print(f"FAIL: tasks.json validation failed: {tasks_path}", file=sys.stderr)
         return 1
 
@@ -0,0 +1,38 @@
+"""Shared pexpect patterns and prompt handling for the async REPL dev helpers."""
+from __future__ import annotations
+
+import re
+import time
+
+import pexpect  # type: ignore
+
+PROMPT = "substrate> "
+PROMPT_RE = re.compile(re.escape(PROMPT))
+# Cursor-position report request emitted by the line editor, and our reply.
+CPR_RE = re.compile(r"\x1b\[6n")
+CPR_REPLY = "\x1b[1;1R"
+# Poll in short slices so EOF and stalls surface promptly with diagnostics.
+POLL_INTERVAL = 0.5
+
+
+def expect_prompt(
+    child: "pexpect.spawn", *, timeout: float = 60, searchwindowsize: int = -1
+) -> None:
+    """Wait for the REPL prompt, answering cursor-position queries if needed."""
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        idx = child.expect(
+            [PROMPT_RE, CPR_RE, pexpect.EOF, pexpect.TIMEOUT],
+            timeout=POLL_INTERVAL,
+            searchwindowsize=searchwindowsize,
+        )
+        if idx == 0:
+            return
+        if idx == 1:
+            child.send(CPR_REPLY)
+        elif idx == 2:
+            raise RuntimeError("substrate exited before prompt was ready")
+    raise RuntimeError(
+        f"Timed out after {timeout}s waiting for substrate prompt; last output: {child.before[-512:]!r}"
+    )
@@ -1,36 +1,54 @@
 #!/usr/bin/env python3
-"""Collect idle CPU metrics for the async REPL."""
+"""Collect idle CPU metrics for the async REPL (Linux; reads /proc)."""
 from __future__ import annotations
 
 import argparse
-import subprocess
+import os
 import time
 from pathlib import Path
 
 import pexpect  # type: ignore
 
-PROMPT = "substrate> "
+from _pexpect_util import expect_prompt
 
 
-def expect_prompt(child: "pexpect.spawn") -> None:
-    while True:
-        idx = child.expect([PROMPT, r"\x1b\[6n", pexpect.EOF], timeout=60)
-        if idx == 0:
-            return
-        if idx == 1:
-            child.send("\x1b[1;1R")
-            continue
-        raise RuntimeError("substrate exited before prompt was ready")
+def read_cpu_ticks(pid: int) -> int:
+    """Return utime + stime (in clock ticks) from /proc/<pid>/stat."""
 
+    with open(f"/proc/{pid}/stat", "rb") as fh:
+        stat = fh.read()
+    # comm (field 2) may contain spaces, so split after its closing paren;
+    # fields[0] is then field 3 (state), making utime/stime fields[11]/[12].
+    fields = stat[stat.rindex(b")") + 2 :].split()
+    return int(fields[11]) + int(fields[12])
 
-def capture_top(pid: int, dest: Path, samples: int) -> None:
+
+def read_rss_kb(pid: int) -> int:
+    with open(f"/proc/{pid}/status", "rb") as fh:
+        for line in fh:
+            if line.startswith(b"VmRSS:"):
+                return int(line.split()[1])
+    return 0
+
+
+def capture_cpu(pid: int, dest: Path, samples: int) -> None:
+    """Write one CPU%/RSS line per second for `pid`, sampled from /proc."""
+
+    clk_tck = os.sysconf("SC_CLK_TCK")
     dest.parent.mkdir(parents=True, exist_ok=True)
     with dest.open("w") as fh:
-        subprocess.run(
-            ["/usr/bin/top", "-b", "-d", "1", "-n", str(samples), "-p", str(pid)],
-            stdout=fh,
-            check=True,
-        )
+        fh.write(f"PID {pid} sampled every 1s from /proc\n")
+        fh.write("sample  %CPU  RES_KB\n")
+        prev_ticks = read_cpu_ticks(pid)
+        prev_time = time.monotonic()
+        for sample in range(1, samples + 1):
+            time.sleep(1)
+            ticks = read_cpu_ticks(pid)
+            now = time.monotonic()
+            cpu = 100.0 * (ticks - prev_ticks) / clk_tck / (now - prev_time)
+            fh.write(f"{sample:>6}  {cpu:>4.1f}  {read_rss_kb(pid):>6}\n")
+            fh.flush()
+            prev_ticks, prev_time = ticks, now
 
 
 def main() -> None:
@@ -39,7 +57,7 @@ def main() -> None:
         "--output",
         type=Path,
         default=Path("docs/project_management/now/stage4_idle_top_linux.txt"),
-        help="File to write top output",
+        help="File to write CPU/RSS samples",
     )
     parser.add_argument("--samples", type=int, default=5)
     args = parser.parse_args()
@@ -54,7 +72,7 @@ def main() -> None:
     try:
         expect_prompt(child)
         pid = child.pid
-        capture_top(pid, args.output, args.samples)
+        capture_cpu(pid, args.output, args.samples)
         child.sendline("")
         child.sendline("exit")
     finally:
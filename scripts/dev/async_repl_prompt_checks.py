@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import argparse
 import io
+import re
 import sys
 import time
 from pathlib import Path
@@ -28,21 +29,18 @@ except ImportError as exc:  # pragma: no cover - developer guidance
         "pexpect is required. Install with `pip install pexpect`."
     ) from exc
 
+from _pexpect_util import CPR_RE, CPR_REPLY, expect_prompt
 
-PROMPT = "substrate> "
 
-
-def expect_prompt(child: "pexpect.spawn", *, timeout: int = 30) -> None:
-    """Wait for the REPL prompt, answering cursor-position queries if needed."""
-
-    while True:
-        idx = child.expect([PROMPT, "\x1b\[6n", pexpect.TIMEOUT], timeout=timeout)
-        if idx == 0:
-            return
-        if idx == 1:
-            child.send("\x1b[1;1R")
-            continue
-        raise RuntimeError("Timed out waiting for substrate prompt")
+# Default characters sent per pty write when simulating typing; `--slow-type`
+# passes 1 instead for regressions that need true per-keystroke timing.
+TYPE_CHUNK = 8
+# Read large pty chunks so bursty agent output is drained in few reads.
+MAXREAD = 65536
+DEMO_EVENT_RE = re.compile(r"Demo agent event #\d+")
+# Printed by the wrapping shell right before each substrate launch, so a drill can
+# tell a fresh session's prompt from a redraw left in the buffer by the previous one.
+SESSION_MARKER = "async-repl-session-{n}-start"
 
 
 def expect_with_handshake(
@@ -51,37 +49,88 @@ def expect_with_handshake(
     """Expect a pattern while answering cursor-position probes."""
 
     while True:
-        idx = child.expect([pattern, "\x1b\[6n"], timeout=timeout)
+        idx = child.expect([pattern, CPR_RE], timeout=timeout)
         if idx == 0:
             return
-        child.send("\x1b[1;1R")
+        child.send(CPR_REPLY)
+
+
+def expect_count(
+    child: "pexpect.spawn", pattern: "re.Pattern[str]", count: int, *, timeout: int = 20
+) -> None:
+    """Consume `count` matches of a compiled pattern within one overall timeout."""
+
+    deadline = time.monotonic() + timeout
+    seen = 0
+    while seen < count:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise RuntimeError(
+                f"Timed out after {seen}/{count} matches of {pattern.pattern!r}"
+            )
+        idx = child.expect([pattern, CPR_RE], timeout=remaining)
+        if idx == 0:
+            seen += 1
+        else:
+            child.send(CPR_REPLY)
 
 
-def spawn_async_shell() -> "pexpect.spawn":
+def spawn_async_shell(*, sessions: int = 1) -> "pexpect.spawn":
+    """Start substrate under one login shell, relaunching it `sessions` times.
+
+    Each `exit` from the REPL starts the next substrate process in the same
+    shell, so multi-session drills pay the shell-init cost only once.
+    """
+
+    launches = [
+        f"echo {SESSION_MARKER.format(n=n)}; target/debug/substrate --no-world"
+        for n in range(1, sessions + 1)
+    ]
     cmd = (
         "if [ -f ~/.substrate/dev-shim-env.sh ]; then "
         "source ~/.substrate/dev-shim-env.sh; "
-        "fi; "
-        "target/debug/substrate --no-world"
+        "fi; " + "; ".join(launches)
     )
     child = pexpect.spawn("bash", ["-lc", cmd], encoding="utf-8", timeout=60)
-    expect_prompt(child)
+    child.maxread = MAXREAD
+    expect_session_start(child, 1)
     return child
 
 
+def expect_session_start(child: "pexpect.spawn", n: int) -> None:
+    """Wait for substrate session `n` to launch, then for its first prompt."""
+
+    expect_with_handshake(child, re.escape(SESSION_MARKER.format(n=n)))
+    expect_prompt(child)
+
+
 def _send_command(child: "pexpect.spawn", command: str) -> None:
-    child.send(command)
-    child.send("\r")
+    child.send(command + "\r")
+
 
+def queue_commands(child: "pexpect.spawn", commands: list[str]) -> None:
+    """Submit several commands in one write, then wait for each prompt."""
 
-def scenario_typing_mid_stream(child: "pexpect.spawn") -> None:
+    child.send("".join(command + "\r" for command in commands))
+    for _ in commands:
+        expect_prompt(child)
+
+
+def _type(
+    child: "pexpect.spawn", text: str, *, delay: float = 0.04, chunk: int = TYPE_CHUNK
+) -> None:
+    """Simulate typing by sending `text` in `chunk`-sized writes with a pause between each."""
+
+    for i in range(0, len(text), chunk):
+        child.send(text[i : i + chunk])
+        time.sleep(delay)
+
+
+def scenario_typing_mid_stream(child: "pexpect.spawn", *, type_chunk: int = TYPE_CHUNK) -> None:
     child.send(":demo-agent\r")
     expect_prompt(child)
 
-    command = "echo typing while agents stream"
-    for ch in command:
-        child.send(ch)
-        time.sleep(0.04)
+    _type(child, "echo typing while agents stream", delay=0.04, chunk=type_chunk)
 
     for marker in ["\\[demo\\] Demo agent event #1", "\\[demo\\] Demo agent event #2", "\\[demo\\] Demo agent event #3"]:
         child.expect(marker)
@@ -91,35 +140,26 @@ def scenario_typing_mid_stream(child: "pexpect.spawn") -> None:
     expect_prompt(child)
 
 
-def scenario_long_line_burst(child: "pexpect.spawn") -> None:
+def scenario_long_line_burst(child: "pexpect.spawn", *, type_chunk: int = TYPE_CHUNK) -> None:
     # Schedule three demo agents back-to-back for overlapping output.
-    for _ in range(3):
-        child.send(":demo-agent\r")
-        expect_prompt(child)
+    queue_commands(child, [":demo-agent"] * 3)
 
     payload = "X" * 96
-    command = f"echo {payload}"
-    for ch in command:
-        child.send(ch)
-        time.sleep(0.02)
+    _type(child, f"echo {payload}", delay=0.02, chunk=type_chunk)
 
     # Expect nine progress events (three agents * three events each).
-    for _ in range(9):
-        expect_with_handshake(child, "Demo agent event #", timeout=10)
+    expect_count(child, DEMO_EVENT_RE, 9, timeout=20)
 
     child.send("\r")
     expect_with_handshake(child, f"{payload}\r\n")
     expect_prompt(child)
 
 
-def scenario_control_chars(child: "pexpect.spawn") -> None:
+def scenario_control_chars(child: "pexpect.spawn", *, type_chunk: int = TYPE_CHUNK) -> None:
     child.send(":demo-agent\r")
     expect_prompt(child)
 
-    command = "echo control-case"
-    for ch in command:
-        child.send(ch)
-        time.sleep(0.03)
+    _type(child, "echo control-case", delay=0.03, chunk=type_chunk)
 
     child.send("\x7f" * 5)  # remove '-case'
     child.send("check")
@@ -132,7 +172,7 @@ def scenario_control_chars(child: "pexpect.spawn") -> None:
     expect_prompt(child)
 
 
-def run_drills(log_path: Path) -> None:
+def run_drills(log_path: Path, *, type_chunk: int = TYPE_CHUNK) -> None:
     log_path.parent.mkdir(parents=True, exist_ok=True)
     with log_path.open("w", encoding="utf-8") as log_file:
         log_file.write("# Stage 4 Prompt Integrity Drills\n")
@@ -143,15 +183,15 @@ def run_drills(log_path: Path) -> None:
         try:
             log_file.write("\n## Scenario 1: typing while events stream\n")
             log_file.flush()
-            scenario_typing_mid_stream(child)
+            scenario_typing_mid_stream(child, type_chunk=type_chunk)
 
             log_file.write("\n## Scenario 2: long command under bursty output\n")
             log_file.flush()
-            scenario_long_line_burst(child)
+            scenario_long_line_burst(child, type_chunk=type_chunk)
 
             log_file.write("\n## Scenario 3: backspace edits during events\n")
             log_file.flush()
-            scenario_control_chars(child)
+            scenario_control_chars(child, type_chunk=type_chunk)
 
             _send_command(child, "exit")
             child.expect(pexpect.EOF)
@@ -165,10 +205,12 @@ def run_stage5_checks(log_path: Path) -> None:
         log_file.write("# Stage 5 History & Completion Drills\n")
         log_file.flush()
 
-        # Session 1: populate history and exercise completion while streaming.
-        child = spawn_async_shell()
+        # Both sessions share one login shell; substrate is relaunched in it
+        # after session 1 exits so history must round-trip through disk.
+        child = spawn_async_shell(sessions=2)
         child.logfile = log_file
         try:
+            # Session 1: populate history and exercise completion while streaming.
             log_file.write("\n## Session 1: populate history and test completion with streaming output\n")
             log_file.flush()
 
@@ -183,8 +225,7 @@ def run_stage5_checks(log_path: Path) -> None:
             time.sleep(0.05)
             child.send("\t")
             time.sleep(0.05)
-            child.send("ho stage5-completion")
-            child.send("\r")
+            child.send("ho stage5-completion\r")
             expect_with_handshake(child, "stage5-completion\r\n")
             expect_prompt(child)
 
@@ -192,14 +233,11 @@ def run_stage5_checks(log_path: Path) -> None:
             expect_prompt(child)
 
             _send_command(child, "exit")
-            child.expect(pexpect.EOF)
-        finally:
-            child.close()
 
-        # Session 2: verify history persistence across fresh shell.
-        child = spawn_async_shell()
-        child.logfile = log_file
-        try:
+            # Session 2: verify history persistence across a fresh substrate process.
+            # Wait for its launch marker first; a prompt redraw from session 1 may still
+            # be buffered and would otherwise satisfy expect_prompt.
+            expect_session_start(child, 2)
             log_file.write("\n## Session 2: verify history recall in new session\n")
             log_file.flush()
 
@@ -229,9 +267,14 @@ def main(argv: list[str] | None = None) -> int:
         default=Path("docs/project_management/now/stage5_prompt_checks_transcript.txt"),
         help="Path to write the Stage 5 transcript.",
     )
+    parser.add_argument(
+        "--slow-type",
+        action="store_true",
+        help="Send simulated typing one character at a time instead of in chunks.",
+    )
     args = parser.parse_args(argv)
 
-    run_drills(args.log)
+    run_drills(args.log, type_chunk=1 if args.slow_type else TYPE_CHUNK)
     print(f"Prompt drill transcript written to {args.log}")
 
     run_stage5_checks(args.stage5_log)
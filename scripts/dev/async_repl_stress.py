@@ -21,24 +21,30 @@ except ImportError as exc:  # pragma: no cover - guidance for developers
         "pexpect is required for this helper. Install with `pip install pexpect`."
     ) from exc
 
+from _pexpect_util import PROMPT, expect_prompt
 
-PROMPT = "substrate> "
 
+# Read large pty chunks and only search the tail of the buffer during bursts.
+MAXREAD = 65536
+BURST_SEARCH_WINDOW = 64
+# pexpect < 4.8 rebuilds its match buffer as an immutable string on every read,
+# which turns long bursts into quadratic searches.
+MIN_PEXPECT_VERSION = (4, 8)
 
-def expect_prompt(child: "pexpect.spawn") -> None:
-    while True:
-        idx = child.expect([PROMPT, "\\x1b\\[6n", pexpect.EOF], timeout=60)
-        if idx == 0:
-            return
-        if idx == 1:
-            child.send("\x1b[1;1R")
-            continue
-        raise RuntimeError("substrate exited before prompt was ready")
+
+def pexpect_version() -> tuple[int, ...]:
+    parts = []
+    for part in pexpect.__version__.split(".")[:2]:
+        digits = "".join(ch for ch in part if ch.isdigit())
+        parts.append(int(digits) if digits else 0)
+    return tuple(parts)
 
 
 def spawn_substrate() -> "pexpect.spawn":
     cmd = "source ~/.substrate/dev-shim-env.sh && target/debug/substrate --no-world"
     child = pexpect.spawn("bash", ["-lc", cmd], encoding="utf-8", timeout=60)
+    child.maxread = MAXREAD
+    child.searchwindowsize = len(PROMPT) + 16
     expect_prompt(child)
     return child
 
@@ -67,7 +73,7 @@ def run_demo_burst(child: "pexpect.spawn", agents: int, events: int, delay_ms: i
     cmd = f":demo-burst {agents} {events} {delay_ms}"
     child.sendline(cmd)
     start = time.perf_counter()
-    expect_prompt(child)
+    expect_prompt(child, searchwindowsize=BURST_SEARCH_WINDOW)
     end = time.perf_counter()
     return end - start
 
@@ -79,6 +85,14 @@ def main() -> None:
     parser.add_argument("--delay-ms", type=int, default=0)
     args = parser.parse_args()
 
+    if pexpect_version() < MIN_PEXPECT_VERSION:
+        print(
+            f"error: pexpect>=4.8 is required for this helper (found {pexpect.__version__}). "
+            "Install with `pip install 'pexpect>=4.8'`.",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
     child = spawn_substrate()
     try:
         run_ctrl_c_check(child)